@@ -3,9 +3,19 @@ Conversation Analyzer
 Analyzes conversation flow, extracts information, and determines outcomes
 """
 import re
+import sys
 import logging
-from typing import List, Dict, Any, Set
+import functools
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import List, Dict, Any, Set, Tuple, Optional
 from pathlib import Path
+try:
+    # Optional: RE2 matches in linear time, so the [^.!?\n]+ scans below cannot
+    # backtrack quadratically on long conversations. Falls back to stdlib re.
+    import re2 as _re_fast
+except ImportError:
+    _re_fast = re
 from .models import (
     ConversationSummary, ConversationOutcome, InformationGathered, ConversationTurn,
     FailureCategory, FailureDetail, ConversationStatus
@@ -13,64 +23,354 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+_RECRUITER_PROMPT_PATH = Path("prompts/recruiter_v1.txt")
+
+# Prompt field names -> analysis field names
+_FIELD_MAPPING = MappingProxyType({
+    'Job Title': 'job_title',
+    'Workplace Type': 'workplace_type',
+    'Employment Type': 'employment_type',
+    'Location': 'location',
+    'Seniority Level': 'seniority_level',
+    'Education Level': 'education_level',
+    'Skills': 'skills',
+    'Vacancies': 'vacancies',
+    'Languages': 'languages',
+    'Responsibilities': 'responsibilities',
+    'Application deadline': 'application_deadline',
+    'Salary Range': 'salary_range',
+    'Recruiter/Contact person': 'recruiter_contact',
+    'Internal Notes': 'internal_notes'
+})
+
+# Lowercased prompt names for partial matching, in _FIELD_MAPPING order
+_FIELD_MAPPING_LOWER = tuple(
+    (prompt_field.lower(), analysis_field) for prompt_field, analysis_field in _FIELD_MAPPING.items()
+)
+
+# Fallback when the recruiter prompt is missing or has no mandatory section
+_DEFAULT_MANDATORY_FIELDS = MappingProxyType({
+    'job_title': 'Job Title',
+    'workplace_type': 'Workplace Type',
+    'employment_type': 'Employment Type',
+    'location': 'Location',
+    'seniority_level': 'Seniority Level',
+    'skills': 'Skills',
+    'responsibilities': 'Responsibilities',
+    'salary_range': 'Salary Range'
+})
+
+# Extraction patterns are compiled once at import. They run against the
+# lowercased conversation, so no IGNORECASE flag is needed except where the
+# original-case text is scanned (salary).
+_JOB_TITLE_SUFFIXES = (
+    r'developer|engineer|manager|analyst|specialist|coordinator|director|lead|architect|consultant|designer|marketer|sales|'
+    r'accountant|lawyer|doctor|nurse|teacher|writer|editor|administrator|executive|officer|representative|assistant|clerk|'
+    r'technician|operator|supervisor|coordinator'
+)
+
+_RE_JOB_TITLE_LIST = (
+    _re_fast.compile(r'(?:job title|position|role|hiring for|looking for|need a|want a)\s*:?\s*([^.!?\n]+)'),
+    _re_fast.compile(rf'(?:is|are|would be|should be)\s+(?:a\s+)?([^.!?\n]+(?:{_JOB_TITLE_SUFFIXES}))'),
+    _re_fast.compile(rf'(?:we need|looking for|hiring)\s+(?:a\s+)?([^.!?\n]+(?:{_JOB_TITLE_SUFFIXES}))'),
+)
+
+_RE_LOCATION = (
+    _re_fast.compile(r'(?:in|at|based in|located in|working in)\s+([^.!?\n,]+(?:city|town|state|country|remote|hybrid|onsite))'),
+    re.compile(r'(?:remote|hybrid|onsite|on-site)'),
+)
+
+# Known city names for location extraction. Matched as whole words through a
+# first-word index instead of one large regex alternation.
+_CITIES = (
+    'san francisco', 'sf', 'new york', 'ny', 'los angeles', 'la', 'chicago', 'boston', 'seattle',
+    'austin', 'denver', 'miami', 'atlanta', 'phoenix', 'dallas', 'houston', 'philadelphia',
+    'detroit', 'minneapolis', 'portland', 'las vegas', 'orlando', 'tampa', 'nashville',
+    'pittsburgh', 'cleveland', 'columbus', 'indianapolis', 'milwaukee', 'kansas city',
+    'salt lake city', 'richmond', 'norfolk', 'greensboro', 'raleigh', 'charlotte', 'jacksonville',
+    'memphis', 'louisville', 'birmingham', 'oklahoma city', 'tulsa', 'wichita', 'omaha',
+    'des moines', 'cedar rapids', 'davenport', 'rockford', 'peoria', 'springfield', 'madison',
+    'rochester', 'buffalo', 'syracuse', 'albany', 'utica', 'binghamton', 'poughkeepsie',
+    'newburgh', 'kingston', 'glens falls', 'watertown', 'ogdensburg', 'massena', 'plattsburgh',
+    'burlington', 'rutland', 'barre', 'montpelier', 'concord', 'nashua', 'manchester',
+    'portsmouth', 'dover', 'laconia', 'berlin', 'claremont', 'lebanon', 'keene', 'exeter',
+    'hampton', 'salem', 'derry', 'hudson', 'londonderry', 'merrimack', 'bedford', 'goffstown',
+    'weare', 'new boston', 'lyndeborough', 'mont vernon', 'amherst', 'milford', 'wilton', 'mason',
+    'greenville', 'new ipswich', 'jaffrey', 'peterborough', 'temple', 'sharon', 'dublin',
+    'hancock', 'antrim', 'bennington', 'francestown', 'greenfield',
+)
+
+
+def _build_city_index(cities) -> Dict[str, tuple]:
+    """Map each city's first word to (city, remaining words) pairs, longest first"""
+    index: Dict[str, list] = {}
+    for city in cities:
+        words = city.split()
+        index.setdefault(words[0], []).append((city, tuple(words[1:])))
+    return {
+        first: tuple(sorted(entries, key=lambda entry: -len(entry[1])))
+        for first, entries in index.items()
+    }
+
+
+_CITY_INDEX = _build_city_index(_CITIES)
+_RE_WORD = re.compile(r'\w+')
+
+# Phrases that mark a SUT summary, proxy confirmation and persona quality
+_SUMMARY_PHRASES = (
+    "here's the role", "here is the role", "to summarize", "summary of the role",
+    "candidate preview", "publish", "job description", "role summary",
+    "should i lock these in", "great, i've got everything"
+)
+
+_CONFIRMATION_PHRASES = (
+    "yes", "looks good", "that's correct", "perfect", "sounds good",
+    "that works", "confirmed", "accurate", "exactly what i need"
+)
+
+_ROLE_ADHERENCE_PHRASES = (
+    "sorry, i'm the one who needs help",
+)
+
+_PERSONA_CHARACTERISTICS = (
+    "drowning in work", "systems are getting hammered"
+)
+
+# Proxy phrases that signal role reversal or breaking character
+_RECRUITER_PHRASES = (
+    "i can help you with", "let me ask you about", "what's your budget",
+    "i'll need to know", "let me gather", "i'm here to help you find"
+)
+
+_BREAKING_CHARACTER_PHRASES = (
+    "i'm an ai", "as an ai", "i'm a language model", "i'm not real",
+    "this is a simulation", "i'm programmed"
+)
+
+# SUT phrases that break the recruiter role
+_SUT_INABILITY_PHRASES = (
+    "i don't know", "i can't help"
+)
+
+# Proxy phrases that mark a tangent
+_TANGENT_PHRASES = (
+    "by the way", "anyway"
+)
+
+# Canonical label -> phrases, in priority order: an earlier label wins even if a
+# later one appears first in the text. "intern" also covers "internship".
+_EMPLOYMENT_TYPE_PHRASES = (
+    ("Full-time", ("full-time", "fulltime")),
+    ("Part-time", ("part-time", "parttime")),
+    ("Contract", ("contract",)),
+    ("Internship", ("intern",)),
+)
+
+_WORKPLACE_TYPE_PHRASES = (
+    ("Remote", ("remote",)),
+    ("Hybrid", ("hybrid",)),
+    ("Onsite", ("onsite", "on-site")),
+)
+
+# key_information_gathered category -> phrases that mark it in a SUT response
+_KEY_INFO_PHRASES = (
+    ("role_requirements", ("job title:", "salary range:", "experience level:")),
+    ("work_location", ("location:", "remote")),
+    ("technical_skills", ("skills:", "technologies:")),
+)
+
+_RE_SENIORITY_LIST = (
+    re.compile(r'(?:junior|entry-level|entry level|associate|assistant)'),
+    re.compile(r'(?:mid-level|mid level|intermediate|middle)'),
+    re.compile(r'(?:senior|sr\.|sr)'),
+    re.compile(r'(?:lead|principal|staff|architect)'),
+    re.compile(r'(?:director|vp|vice president|executive|chief)'),
+)
+
+_RE_SKILLS_LIST = (
+    _re_fast.compile(r'(?:skills|technologies|tools|requirements|must have|nice to have)[:\s]+([^.!?\n]+)'),
+    _re_fast.compile(r'(?:experience with|knowledge of|proficient in|familiar with)[:\s]+([^.!?\n]+)'),
+)
+
+_RE_SALARY = (
+    re.compile(r'\$[\d,]+(?:-\$[\d,]+)?', re.IGNORECASE),
+    re.compile(r'(?:salary|pay|compensation)[:\s]+([^.!?\n]+)', re.IGNORECASE),
+    re.compile(r'(?:budget|range)[:\s]+([^.!?\n]+)', re.IGNORECASE),
+)
+
+_RE_RESPONSIBILITIES_LIST = (
+    _re_fast.compile(r'(?:responsibilities|duties|tasks|what they will do|role involves)[:\s]+([^.!?\n]+)'),
+    _re_fast.compile(r'(?:will be responsible for|will handle|will manage)[:\s]+([^.!?\n]+)'),
+)
+
+_RE_MANDATORY_SECTION = re.compile(r"### 🧱 MANDATORY FIELDS TO EXTRACT.*?(?=###|\Z)", re.DOTALL | re.IGNORECASE)
+_RE_BULLET_STRIP = re.compile(r'^[-*]\s*')
+_RE_SKILL_SPLIT = re.compile(r'[,;|&]|\band\b')
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_generic(field_lower: str) -> tuple:
+    """Compile the explicit-mention patterns for a generic field, once per process.
+
+    Returns (primary, fallbacks). Any text the fallbacks match is also matched
+    by the primary pattern, so they only need to run when the primary found
+    mentions but none with a usable value.
+    """
+    return (
+        _re_fast.compile(rf'{field_lower}[:\s]+([^.!?\n]+)'),
+        (
+            _re_fast.compile(rf'{field_lower}\s+is\s+([^.!?\n]+)'),
+            _re_fast.compile(rf'{field_lower}\s+will be\s+([^.!?\n]+)'),
+        ),
+    )
+
+class _PhraseMatcher:
+    """Matches a fixed set of lowercase phrases against lowercased text.
+
+    Built once per phrase set. A single call reports every phrase present, so
+    callers that need both "did anything match" and "which phrases matched" scan
+    the text once. Matching uses str containment, which CPython runs as a C-level
+    substring search; for phrase sets this small it outperforms a regex
+    alternation over the same phrases.
+    """
+
+    __slots__ = ("phrases", "min_length", "_search_order")
+
+    def __init__(self, phrases: Tuple[str, ...]):
+        self.phrases = tuple(phrases)
+        # Text shorter than the shortest phrase cannot contain any of them
+        self.min_length = min(map(len, self.phrases), default=0)
+        # Shortest phrases are probed first: they are the likeliest to hit
+        # ("yes") and the cheapest to scan for
+        self._search_order = tuple(sorted(self.phrases, key=len))
+
+    def search(self, text: str) -> bool:
+        """Return True as soon as any phrase is found in text"""
+        if len(text) < self.min_length:
+            return False
+        for phrase in self._search_order:
+            if phrase in text:
+                return True
+        return False
+
+    def findall(self, text: str) -> List[str]:
+        """Return all phrases found in text, in phrase-set order"""
+        return [phrase for phrase in self.phrases if phrase in text]
+
+@dataclass(frozen=True, slots=True)
+class _TurnView:
+    """A conversation turn with its content lowercased once up front"""
+    role: str
+    content: str
+    content_lower: str
+
+
+def _turn_views(turns: List[Dict[str, Any]]) -> List[_TurnView]:
+    """Build the per-turn views shared by every check in one analyzer call"""
+    return [
+        _TurnView(
+            role=turn.get("role", "unknown"),
+            content=(content := turn.get("content", "")),
+            content_lower=content.lower()
+        )
+        for turn in turns
+    ]
+
+
 class ConversationAnalyzer:
     """Analyzes conversations and extracts structured information"""
     
+    # Phrase sets are shared by every instance; matchers are built once at import
+    summary_phrases = _SUMMARY_PHRASES
+    confirmation_phrases = _CONFIRMATION_PHRASES
+    role_adherence_phrases = _ROLE_ADHERENCE_PHRASES
+    persona_characteristics = _PERSONA_CHARACTERISTICS
+    
+    _summary_matcher = _PhraseMatcher(_SUMMARY_PHRASES)
+    _confirmation_matcher = _PhraseMatcher(_CONFIRMATION_PHRASES)
+    _role_adherence_matcher = _PhraseMatcher(_ROLE_ADHERENCE_PHRASES)
+    _persona_matcher = _PhraseMatcher(_PERSONA_CHARACTERISTICS)
+    _recruiter_matcher = _PhraseMatcher(_RECRUITER_PHRASES)
+    _breaking_character_matcher = _PhraseMatcher(_BREAKING_CHARACTER_PHRASES)
+    _sut_inability_matcher = _PhraseMatcher(_SUT_INABILITY_PHRASES)
+    _tangent_matcher = _PhraseMatcher(_TANGENT_PHRASES)
+    
+    # Structured-data markers in SUT responses, in report order
+    _key_info_matchers = tuple(
+        (category, _PhraseMatcher(phrases))
+        for category, phrases in _KEY_INFO_PHRASES
+    )
+    
+    _employment_type_matchers = tuple(
+        (label, _PhraseMatcher(phrases)) for label, phrases in _EMPLOYMENT_TYPE_PHRASES
+    )
+    _workplace_type_matchers = tuple(
+        (label, _PhraseMatcher(phrases)) for label, phrases in _WORKPLACE_TYPE_PHRASES
+    )
+    
     def __init__(self):
-        self.summary_phrases = [
-            "here's the role", "here is the role", "to summarize", "summary of the role",
-            "candidate preview", "publish", "job description", "role summary",
-            "should i lock these in", "great, i've got everything"
-        ]
         self.mandatory_fields = self._load_mandatory_fields()
         
-        self.confirmation_phrases = [
-            "yes", "looks good", "that's correct", "perfect", "sounds good",
-            "that works", "confirmed", "accurate", "exactly what i need"
-        ]
-        
-        self.role_adherence_phrases = [
-            "sorry, i'm the one who needs help"
-        ]
+        # Field key -> (extractor, whether it reads the original-case text)
+        self._field_extractors = {
+            'job_title': (self._extract_job_title, False),
+            'location': (self._extract_location, False),
+            'employment_type': (self._extract_employment_type, False),
+            'workplace_type': (self._extract_workplace_type, False),
+            'seniority_level': (self._extract_seniority_level, False),
+            'skills': (self._extract_skills_text, False),
+            'salary_range': (self._extract_salary_range, True),
+            'responsibilities': (self._extract_responsibilities, False),
+        }
         
-        self.persona_characteristics = [
-            "drowning in work", "systems are getting hammered"
-        ]
+        # (conversation, fields_key, fields) from the last _extract_all_fields call
+        self._fields_memo: Optional[Tuple[str, Tuple[Tuple[str, str], ...], Tuple[Tuple[str, str], ...]]] = None
         
     def _load_mandatory_fields(self) -> Dict[str, str]:
         """Load mandatory fields from the recruiter prompt dynamically"""
         try:
-            prompt_path = Path("prompts/recruiter_v1.txt")
-            if not prompt_path.exists():
+            prompt_path = _RECRUITER_PROMPT_PATH
+            try:
+                mtime_ns = prompt_path.stat().st_mtime_ns
+            except FileNotFoundError:
                 logger.warning("Recruiter prompt not found, using default fields")
                 return self._get_default_mandatory_fields()
             
-            with open(prompt_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Find the mandatory fields section
-            mandatory_section = self._extract_mandatory_section(content)
-            if not mandatory_section:
-                logger.warning("Could not find mandatory fields section, using defaults")
-                return self._get_default_mandatory_fields()
-            
-            # Parse the fields
-            fields = self._parse_mandatory_fields(mandatory_section)
-            logger.debug(f"Loaded {len(fields)} mandatory fields: {list(fields.keys())}")
-            return fields
+            # Parsed once per (path, mtime); copy so callers can't mutate the cache
+            return dict(ConversationAnalyzer._load_cached(str(prompt_path), mtime_ns))
             
         except Exception as e:
             logger.error(f"Error loading mandatory fields: {e}")
             return self._get_default_mandatory_fields()
     
-    def _extract_mandatory_section(self, content: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def _load_cached(prompt_path: str, mtime_ns: int) -> Dict[str, str]:
+        """Read and parse the mandatory fields; mtime_ns invalidates the cache on edit"""
+        with open(prompt_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        
+        # Find the mandatory fields section
+        mandatory_section = ConversationAnalyzer._extract_mandatory_section(content)
+        if not mandatory_section:
+            logger.warning("Could not find mandatory fields section, using defaults")
+            return _DEFAULT_MANDATORY_FIELDS
+        
+        # Parse the fields
+        fields = ConversationAnalyzer._parse_mandatory_fields(mandatory_section)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Loaded %d mandatory fields: %s", len(fields), list(fields.keys()))
+        return fields
+    
+    @staticmethod
+    def _extract_mandatory_section(content: str) -> str:
         """Extract the mandatory fields section from the prompt"""
         # Look for the mandatory fields section
-        pattern = r"### 🧱 MANDATORY FIELDS TO EXTRACT.*?(?=###|\Z)"
-        match = re.search(pattern, content, re.DOTALL | re.IGNORECASE)
+        match = _RE_MANDATORY_SECTION.search(content)
         return match.group(0) if match else ""
     
-    def _parse_mandatory_fields(self, section: str) -> Dict[str, str]:
+    @staticmethod
+    def _parse_mandatory_fields(section: str) -> Dict[str, str]:
         """Parse mandatory fields from the section text"""
         fields = {}
         lines = section.split('\n')
@@ -82,7 +382,7 @@ class ConversationAnalyzer:
                 continue
             
             # Remove bullet points and extract field name
-            field_line = re.sub(r'^[-*]\s*', '', line)
+            field_line = _RE_BULLET_STRIP.sub('', line)
             if '→' in field_line:
                 # Handle sub-fields like "If remote/hybrid → Time Zones Allowed"
                 field_line = field_line.split('→')[0].strip()
@@ -91,37 +391,23 @@ class ConversationAnalyzer:
             field_name = field_line.replace(':', '').strip()
             if field_name:
                 # Map to analysis field names
-                analysis_field = self._map_field_to_analysis(field_name)
+                analysis_field = ConversationAnalyzer._map_field_to_analysis(field_name)
                 fields[analysis_field] = field_name
         
         return fields
     
-    def _map_field_to_analysis(self, field_name: str) -> str:
+    @staticmethod
+    def _map_field_to_analysis(field_name: str) -> str:
         """Map prompt field names to analysis field names"""
-        field_mapping = {
-            'Job Title': 'job_title',
-            'Workplace Type': 'workplace_type', 
-            'Employment Type': 'employment_type',
-            'Location': 'location',
-            'Seniority Level': 'seniority_level',
-            'Education Level': 'education_level',
-            'Skills': 'skills',
-            'Vacancies': 'vacancies',
-            'Languages': 'languages',
-            'Responsibilities': 'responsibilities',
-            'Application deadline': 'application_deadline',
-            'Salary Range': 'salary_range',
-            'Recruiter/Contact person': 'recruiter_contact',
-            'Internal Notes': 'internal_notes'
-        }
-        
         # Try exact match first
-        if field_name in field_mapping:
-            return field_mapping[field_name]
+        analysis_field = _FIELD_MAPPING.get(field_name)
+        if analysis_field is not None:
+            return analysis_field
         
         # Try partial matches
-        for prompt_field, analysis_field in field_mapping.items():
-            if prompt_field.lower() in field_name.lower():
+        field_lower = field_name.lower()
+        for prompt_field_lower, analysis_field in _FIELD_MAPPING_LOWER:
+            if prompt_field_lower in field_lower:
                 return analysis_field
         
         # Default to snake_case version
@@ -129,29 +415,7 @@ class ConversationAnalyzer:
     
     def _get_default_mandatory_fields(self) -> Dict[str, str]:
         """Get default mandatory fields if parsing fails"""
-        return {
-            'job_title': 'Job Title',
-            'workplace_type': 'Workplace Type',
-            'employment_type': 'Employment Type', 
-            'location': 'Location',
-            'seniority_level': 'Seniority Level',
-            'skills': 'Skills',
-            'responsibilities': 'Responsibilities',
-            'salary_range': 'Salary Range'
-        }
-        
-        self.confirmation_phrases = [
-            "yes", "looks good", "that's correct", "perfect", "sounds good",
-            "that works", "confirmed", "accurate", "exactly what i need"
-        ]
-        
-        self.role_adherence_phrases = [
-            "sorry, i'm the one who needs help"
-        ]
-        
-        self.persona_characteristics = [
-            "drowning in work", "systems are getting hammered"
-        ]
+        return dict(_DEFAULT_MANDATORY_FIELDS)
     
     def extract_conversation_summary(self, turns: List[Dict[str, Any]]) -> ConversationSummary:
         """
@@ -163,43 +427,76 @@ class ConversationAnalyzer:
         Returns:
             ConversationSummary object
         """
-        logger.debug(f"Analyzing conversation with {len(turns)} turns")
+        return self._summarize(_turn_views(turns))
+    
+    def _summarize(self, turn_views: List[_TurnView]) -> ConversationSummary:
+        """Build the ConversationSummary from pre-lowered turn views"""
+        logger.debug("Analyzing conversation with %d turns", len(turn_views))
         
-        conversation_flow = []
         key_information_gathered = []
         
         # Extract conversation flow
-        for i, turn in enumerate(turns):
-            role = turn.get("role", "unknown")
-            content = turn.get("content", "")
-            
-            conversation_flow.append(ConversationTurn(
+        conversation_flow = [
+            ConversationTurn(
                 turn=i + 1,
-                role=role,
-                content=content,
-                content_preview=content[:100] + "..." if len(content) > 100 else content
-            ))
+                role=view.role,
+                content=view.content,
+                content_preview=view.content[:100] + "..." if len(view.content) > 100 else view.content
+            )
+            for i, view in enumerate(turn_views)
+        ]
         
         # Extract key information (look for structured data in SUT responses)
-        for turn in turns:
-            if turn.get("role") == "system":  # SUT responses
-                content = turn.get("content", "").lower()
-                
-                if any(phrase in content for phrase in ["job title:", "salary range:", "experience level:"]):
-                    key_information_gathered.append("role_requirements")
-                
-                if any(phrase in content for phrase in ["location:", "remote"]):
-                    key_information_gathered.append("work_location")
-                
-                if any(phrase in content for phrase in ["skills:", "technologies:"]):
-                    key_information_gathered.append("technical_skills")
+        for view in turn_views:
+            if view.role == "system":  # SUT responses
+                key_information_gathered.extend(
+                    category for category, matcher in self._key_info_matchers
+                    if matcher.search(view.content_lower)
+                )
         
         return ConversationSummary(
-            total_turns=len(turns),
+            total_turns=len(turn_views),
             conversation_flow=conversation_flow,
             key_information_gathered=key_information_gathered
         )
     
+    def analyze(self, turns: List[Dict[str, Any]],
+                sut_provided_summary: bool,
+                proxy_confirmed: bool,
+                timeout_reached: bool = False,
+                api_errors: List[str] = None,
+                elapsed_time: float = 0,
+                timeout_limit: int = 120) -> Tuple[ConversationSummary, ConversationOutcome, InformationGathered]:
+        """
+        Run the summary, outcome and information analyses in one go
+        
+        Equivalent to calling extract_conversation_summary,
+        determine_conversation_outcome and extract_information_gathered, but the
+        turns are read and lowercased once and the text is joined once for all three.
+        
+        Args:
+            turns: List of conversation turns
+            (remaining arguments as for determine_conversation_outcome)
+            
+        Returns:
+            Tuple of (ConversationSummary, ConversationOutcome, InformationGathered)
+        """
+        turn_views = _turn_views(turns)
+        full_conversation = " ".join(view.content for view in turn_views)
+        
+        summary = self._summarize(turn_views)
+        try:
+            outcome = self._determine_outcome(
+                turns, sut_provided_summary, proxy_confirmed, timeout_reached,
+                api_errors, elapsed_time, timeout_limit,
+                turn_views=turn_views, full_conversation=full_conversation
+            )
+            information = self._gather_information(full_conversation)
+        finally:
+            # Don't keep the conversation text alive after the run
+            self._fields_memo = None
+        return summary, outcome, information
+    
     def determine_conversation_outcome(self, turns: List[Dict[str, Any]], 
                                     sut_provided_summary: bool, 
                                     proxy_confirmed: bool,
@@ -222,7 +519,23 @@ class ConversationAnalyzer:
         Returns:
             ConversationOutcome object with detailed failure analysis
         """
-        logger.debug(f"Determining outcome - Summary: {sut_provided_summary}, Confirmed: {proxy_confirmed}, Timeout: {timeout_reached}")
+        return self._determine_outcome(
+            turns, sut_provided_summary, proxy_confirmed, timeout_reached,
+            api_errors, elapsed_time, timeout_limit
+        )
+    
+    def _determine_outcome(self, turns: List[Dict[str, Any]],
+                           sut_provided_summary: bool,
+                           proxy_confirmed: bool,
+                           timeout_reached: bool,
+                           api_errors: List[str],
+                           elapsed_time: float,
+                           timeout_limit: int,
+                           turn_views: List[_TurnView] = None,
+                           full_conversation: str = None) -> ConversationOutcome:
+        """Outcome logic; reuses turn views and joined text when the caller has them"""
+        logger.debug("Determining outcome - Summary: %s, Confirmed: %s, Timeout: %s",
+                     sut_provided_summary, proxy_confirmed, timeout_reached)
         
         failures = []
         api_errors = api_errors or []
@@ -272,12 +585,18 @@ class ConversationAnalyzer:
                 outcome.completion_level = 10
                 outcome.issues.append("api_errors_occurred")
         
+        # Lowercase each turn once; every per-turn check reads these views
+        if turn_views is None:
+            turn_views = _turn_views(turns)
+        if full_conversation is None:
+            full_conversation = " ".join(view.content for view in turn_views)
+        
         # Check for persona drift and protocol violations
-        persona_issues = self._analyze_persona_adherence(turns)
+        persona_issues, quality_indicators = self._analyze_persona_adherence(turn_views)
         failures.extend(persona_issues)
         
         # Check for incomplete information gathering
-        info_issues = self._analyze_information_completeness(turns)
+        info_issues = self._analyze_information_completeness(full_conversation, len(turn_views))
         failures.extend(info_issues)
         
         # Determine success status (only if no major failures)
@@ -304,22 +623,15 @@ class ConversationAnalyzer:
                     reason="SUT did not provide a role summary"
                 ))
         
-        # Check for role-playing quality
-        for turn_idx, turn in enumerate(turns):
-            if turn.get("role") == "user":  # Proxy responses
-                content = turn.get("content", "").lower()
-                
-                if any(phrase in content for phrase in self.role_adherence_phrases):
-                    outcome.success_indicators.append("role_adherence_maintained")
-                
-                if any(phrase in content for phrase in self.persona_characteristics):
-                    outcome.success_indicators.append("persona_characteristics_expressed")
+        # Role-playing quality indicators were collected in the persona pass
+        outcome.success_indicators.extend(quality_indicators)
         
         # Update failures and total count
         outcome.failures = failures
         outcome.total_failures = len(failures)
         
-        logger.debug(f"Outcome determined: {outcome.status.value} ({outcome.completion_level}%) with {outcome.total_failures} failures")
+        logger.debug("Outcome determined: %s (%s%%) with %d failures",
+                     outcome.status.value, outcome.completion_level, outcome.total_failures)
         return outcome
     
     def extract_information_gathered(self, turns: List[Dict[str, Any]]) -> InformationGathered:
@@ -333,16 +645,15 @@ class ConversationAnalyzer:
         Returns:
             InformationGathered object
         """
+        # Combine all conversation content for analysis
+        return self._gather_information(" ".join(turn.get("content", "") for turn in turns))
+    
+    def _gather_information(self, full_conversation: str) -> InformationGathered:
+        """Build the InformationGathered object from the joined conversation text"""
         logger.debug("Extracting information from conversation using dynamic field extraction")
         
         info = InformationGathered()
         
-        # Combine all conversation content for analysis
-        full_conversation = ""
-        for turn in turns:
-            content = turn.get("content", "")
-            full_conversation += f" {content}"
-        
         # Extract information for each mandatory field dynamically
         extracted_fields = self._extract_all_fields(full_conversation)
         
@@ -356,70 +667,47 @@ class ConversationAnalyzer:
         # Store additional fields in a flexible way
         info.experience_level = extracted_fields.get('seniority_level')
         
-        logger.debug(f"Extracted information: Role={info.role_type}, Location={info.location}, Skills={len(info.skills_mentioned)}")
-        logger.debug(f"All extracted fields: {extracted_fields}")
+        logger.debug("Extracted information: Role=%s, Location=%s, Skills=%d",
+                     info.role_type, info.location, len(info.skills_mentioned))
+        logger.debug("All extracted fields: %s", extracted_fields)
         return info
     
     def _extract_all_fields(self, conversation: str) -> Dict[str, str]:
         """Extract all mandatory fields from conversation text"""
-        extracted = {}
+        # The outcome and information passes both extract from the same joined
+        # text, so the last result is reused for the same (conversation, mandatory fields)
+        fields_key = tuple(self.mandatory_fields.items())
+        memo = self._fields_memo
+        if memo is not None and memo[1] == fields_key and memo[0] == conversation:
+            return dict(memo[2])
+        fields = self._extract_fields(conversation, fields_key)
+        self._fields_memo = (conversation, fields_key, fields)
+        return dict(fields)
+    
+    def _extract_fields(self, conversation: str, fields_key: Tuple[Tuple[str, str], ...]) -> Tuple[Tuple[str, str], ...]:
+        """Extract the given (field_key, field_name) pairs as hashable pairs"""
         conversation_lower = conversation.lower()
-        
-        for field_key, field_name in self.mandatory_fields.items():
-            extracted[field_key] = self._extract_field_value(field_key, field_name, conversation, conversation_lower)
-        
-        return extracted
+        return tuple(
+            (field_key, self._extract_field_value(field_key, field_name, conversation, conversation_lower))
+            for field_key, field_name in fields_key
+        )
     
     def _extract_field_value(self, field_key: str, field_name: str, conversation: str, conversation_lower: str) -> str:
         """Extract value for a specific field from conversation"""
-        
-        # Job Title extraction - agnostic to industry
-        if field_key == 'job_title':
-            return self._extract_job_title(conversation, conversation_lower)
-        
-        # Location extraction
-        elif field_key == 'location':
-            return self._extract_location(conversation, conversation_lower)
-        
-        # Employment Type extraction
-        elif field_key == 'employment_type':
-            return self._extract_employment_type(conversation, conversation_lower)
-        
-        # Workplace Type extraction
-        elif field_key == 'workplace_type':
-            return self._extract_workplace_type(conversation, conversation_lower)
-        
-        # Seniority Level extraction
-        elif field_key == 'seniority_level':
-            return self._extract_seniority_level(conversation, conversation_lower)
-        
-        # Skills extraction
-        elif field_key == 'skills':
-            return self._extract_skills_text(conversation, conversation_lower)
-        
-        # Salary Range extraction
-        elif field_key == 'salary_range':
-            return self._extract_salary_range(conversation, conversation_lower)
-        
-        # Responsibilities extraction
-        elif field_key == 'responsibilities':
-            return self._extract_responsibilities(conversation, conversation_lower)
+        entry = self._field_extractors.get(field_key)
         
         # Default extraction - look for explicit mentions
-        else:
-            return self._extract_generic_field(field_name, conversation, conversation_lower)
+        if entry is None:
+            return self._extract_generic_field(field_name, conversation_lower)
+        
+        extractor, needs_original_case = entry
+        return extractor(conversation if needs_original_case else conversation_lower)
     
-    def _extract_job_title(self, conversation: str, conversation_lower: str) -> str:
+    def _extract_job_title(self, conversation_lower: str) -> str:
         """Extract job title - agnostic to industry"""
         # Look for explicit job title mentions
-        job_title_patterns = [
-            r'(?:job title|position|role|hiring for|looking for|need a|want a)\s*:?\s*([^.!?\n]+)',
-            r'(?:is|are|would be|should be)\s+(?:a\s+)?([^.!?\n]+(?:developer|engineer|manager|analyst|specialist|coordinator|director|lead|architect|consultant|designer|marketer|sales|accountant|lawyer|doctor|nurse|teacher|writer|editor|administrator|executive|officer|representative|assistant|clerk|technician|operator|supervisor|coordinator))',
-            r'(?:we need|looking for|hiring)\s+(?:a\s+)?([^.!?\n]+(?:developer|engineer|manager|analyst|specialist|coordinator|director|lead|architect|consultant|designer|marketer|sales|accountant|lawyer|doctor|nurse|teacher|writer|editor|administrator|executive|officer|representative|assistant|clerk|technician|operator|supervisor|coordinator))',
-        ]
-        
-        for pattern in job_title_patterns:
-            matches = re.findall(pattern, conversation_lower, re.IGNORECASE)
+        for pattern in _RE_JOB_TITLE_LIST:
+            matches = pattern.findall(conversation_lower)
             for match in matches:
                 title = match.strip()
                 if len(title) > 3 and len(title) < 50:  # Reasonable length
@@ -427,73 +715,65 @@ class ConversationAnalyzer:
         
         return None
     
-    def _extract_location(self, conversation: str, conversation_lower: str) -> str:
+    def _extract_location(self, conversation_lower: str) -> str:
         """Extract location information"""
         # Common location patterns
-        location_patterns = [
-            r'(?:in|at|based in|located in|working in)\s+([^.!?\n,]+(?:city|town|state|country|remote|hybrid|onsite))',
-            r'(?:remote|hybrid|onsite|on-site)',
-            r'(?:san francisco|sf|new york|ny|los angeles|la|chicago|boston|seattle|austin|denver|miami|atlanta|phoenix|dallas|houston|philadelphia|detroit|minneapolis|portland|las vegas|orlando|tampa|nashville|pittsburgh|cleveland|columbus|indianapolis|milwaukee|kansas city|salt lake city|richmond|norfolk|greensboro|raleigh|charlotte|jacksonville|memphis|louisville|birmingham|oklahoma city|tulsa|wichita|omaha|des moines|cedar rapids|davenport|rockford|peoria|springfield|madison|rochester|buffalo|syracuse|albany|utica|binghamton|poughkeepsie|newburgh|kingston|glens falls|watertown|ogdensburg|massena|plattsburgh|burlington|rutland|barre|montpelier|concord|nashua|manchester|portsmouth|dover|rochester|concord|laconia|berlin|claremont|lebanon|keene|dover|portsmouth|exeter|hampton|salem|derry|hudson|londonderry|merrimack|bedford|goffstown|weare|new boston|lyndeborough|mont vernon|amherst|milford|wilton|mason|greenville|new ipswich|jaffrey|peterborough|temple|sharon|dublin|hancock|antrim|bennington|francestown|greenfield|lyndeborough|mont vernon|new boston|wilton|mason|greenville|new ipswich|jaffrey|peterborough|temple|sharon|dublin|hancock|antrim|bennington|francestown|greenfield)'
-        ]
-        
-        for pattern in location_patterns:
-            matches = re.findall(pattern, conversation_lower, re.IGNORECASE)
+        for pattern in _RE_LOCATION:
+            matches = pattern.findall(conversation_lower)
             for match in matches:
                 location = match.strip()
                 if location and len(location) < 50:
                     return location.title()
         
+        city = self._find_city(conversation_lower)
+        if city:
+            return city.title()
+        
         return None
     
-    def _extract_employment_type(self, conversation: str, conversation_lower: str) -> str:
-        """Extract employment type"""
-        if 'full-time' in conversation_lower or 'fulltime' in conversation_lower:
-            return 'Full-time'
-        elif 'part-time' in conversation_lower or 'parttime' in conversation_lower:
-            return 'Part-time'
-        elif 'contract' in conversation_lower:
-            return 'Contract'
-        elif 'intern' in conversation_lower or 'internship' in conversation_lower:
-            return 'Internship'
+    def _find_city(self, conversation_lower: str) -> str:
+        """Return the first known city mentioned as a whole word, longest name first"""
+        words = _RE_WORD.findall(conversation_lower)
+        for i, word in enumerate(words):
+            candidates = _CITY_INDEX.get(word)
+            if not candidates:
+                continue
+            for city, tail in candidates:
+                if tuple(words[i + 1:i + 1 + len(tail)]) == tail:
+                    return city
+        
         return None
     
-    def _extract_workplace_type(self, conversation: str, conversation_lower: str) -> str:
+    def _extract_employment_type(self, conversation_lower: str) -> str:
+        """Extract employment type"""
+        return self._first_label(self._employment_type_matchers, conversation_lower)
+    
+    def _extract_workplace_type(self, conversation_lower: str) -> str:
         """Extract workplace type"""
-        if 'remote' in conversation_lower:
-            return 'Remote'
-        elif 'hybrid' in conversation_lower:
-            return 'Hybrid'
-        elif 'onsite' in conversation_lower or 'on-site' in conversation_lower:
-            return 'Onsite'
+        return self._first_label(self._workplace_type_matchers, conversation_lower)
+    
+    @staticmethod
+    def _first_label(matchers: tuple, conversation_lower: str) -> str:
+        """Return the label of the first matcher, in priority order, that hits"""
+        for label, matcher in matchers:
+            if matcher.search(conversation_lower):
+                return label
         return None
     
-    def _extract_seniority_level(self, conversation: str, conversation_lower: str) -> str:
+    def _extract_seniority_level(self, conversation_lower: str) -> str:
         """Extract seniority level"""
-        seniority_patterns = [
-            r'(?:junior|entry-level|entry level|associate|assistant)',
-            r'(?:mid-level|mid level|intermediate|middle)',
-            r'(?:senior|sr\.|sr)',
-            r'(?:lead|principal|staff|architect)',
-            r'(?:director|vp|vice president|executive|chief)'
-        ]
-        
-        for pattern in seniority_patterns:
-            if re.search(pattern, conversation_lower, re.IGNORECASE):
-                match = re.search(pattern, conversation_lower, re.IGNORECASE)
+        for pattern in _RE_SENIORITY_LIST:
+            match = pattern.search(conversation_lower)
+            if match:
                 return match.group().title()
         
         return None
     
-    def _extract_skills_text(self, conversation: str, conversation_lower: str) -> str:
+    def _extract_skills_text(self, conversation_lower: str) -> str:
         """Extract skills mentioned in conversation"""
         # Look for skills sections or lists
-        skills_patterns = [
-            r'(?:skills|technologies|tools|requirements|must have|nice to have)[:\s]+([^.!?\n]+)',
-            r'(?:experience with|knowledge of|proficient in|familiar with)[:\s]+([^.!?\n]+)',
-        ]
-        
-        for pattern in skills_patterns:
-            matches = re.findall(pattern, conversation_lower, re.IGNORECASE)
+        for pattern in _RE_SKILLS_LIST:
+            matches = pattern.findall(conversation_lower)
             for match in matches:
                 skills_text = match.strip()
                 if len(skills_text) > 5:
@@ -501,31 +781,20 @@ class ConversationAnalyzer:
         
         return None
     
-    def _extract_salary_range(self, conversation: str, conversation_lower: str) -> str:
+    def _extract_salary_range(self, conversation: str) -> str:
         """Extract salary range"""
-        salary_patterns = [
-            r'\$[\d,]+(?:-\$[\d,]+)?',
-            r'(?:salary|pay|compensation)[:\s]+([^.!?\n]+)',
-            r'(?:budget|range)[:\s]+([^.!?\n]+)',
-        ]
-        
-        for pattern in salary_patterns:
-            matches = re.findall(pattern, conversation, re.IGNORECASE)
+        for pattern in _RE_SALARY:
+            matches = pattern.findall(conversation)
             for match in matches:
                 if '$' in match or 'salary' in match.lower():
                     return match.strip()
         
         return None
     
-    def _extract_responsibilities(self, conversation: str, conversation_lower: str) -> str:
+    def _extract_responsibilities(self, conversation_lower: str) -> str:
         """Extract responsibilities mentioned"""
-        resp_patterns = [
-            r'(?:responsibilities|duties|tasks|what they will do|role involves)[:\s]+([^.!?\n]+)',
-            r'(?:will be responsible for|will handle|will manage)[:\s]+([^.!?\n]+)',
-        ]
-        
-        for pattern in resp_patterns:
-            matches = re.findall(pattern, conversation_lower, re.IGNORECASE)
+        for pattern in _RE_RESPONSIBILITIES_LIST:
+            matches = pattern.findall(conversation_lower)
             for match in matches:
                 responsibilities = match.strip()
                 if len(responsibilities) > 10:
@@ -533,20 +802,21 @@ class ConversationAnalyzer:
         
         return None
     
-    def _extract_generic_field(self, field_name: str, conversation: str, conversation_lower: str) -> str:
+    def _extract_generic_field(self, field_name: str, conversation_lower: str) -> str:
         """Extract generic field by looking for explicit mentions"""
-        field_lower = field_name.lower()
-        
-        # Look for explicit field mentions
-        patterns = [
-            rf'{field_lower}[:\s]+([^.!?\n]+)',
-            rf'{field_lower}\s+is\s+([^.!?\n]+)',
-            rf'{field_lower}\s+will be\s+([^.!?\n]+)',
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, conversation_lower, re.IGNORECASE)
-            for match in matches:
+        primary, fallbacks = _compile_generic(field_name.lower())
+        matches = primary.findall(conversation_lower)
+        if not matches:
+            # The field is never mentioned; the fallbacks cannot match either
+            return None
+        
+        for match in matches:
+            value = match.strip()
+            if len(value) > 2:
+                return value
+        
+        for pattern in fallbacks:
+            for match in pattern.findall(conversation_lower):
                 value = match.strip()
                 if len(value) > 2:
                     return value
@@ -558,114 +828,124 @@ class ConversationAnalyzer:
         if not skills_text:
             return []
         
-        # Split by common delimiters
-        skills = re.split(r'[,;|&]|\band\b', skills_text)
-        
-        # Clean up each skill
-        cleaned_skills = []
-        for skill in skills:
-            skill = skill.strip()
-            if skill and len(skill) > 1:
-                cleaned_skills.append(skill.title())
-        
-        return cleaned_skills
+        # Split by common delimiters and clean up each skill. Skill names repeat heavily
+        # across runs, so interning keeps one shared copy of each per process.
+        return [
+            sys.intern(skill.title())
+            for raw_skill in _RE_SKILL_SPLIT.split(skills_text)
+            if len(skill := raw_skill.strip()) > 1
+        ]
     
-    def check_sut_provided_summary(self, sut_reply: str) -> bool:
+    def check_sut_provided_summary(self, sut_reply: str, content_lower: Optional[str] = None) -> bool:
         """
         Check if SUT provided a summary
         
         Args:
             sut_reply: SUT response text
+            content_lower: sut_reply already lowercased, if the caller has it
             
         Returns:
             True if summary was provided
         """
-        return any(phrase in sut_reply.lower() for phrase in self.summary_phrases)
+        if content_lower is None:
+            content_lower = sut_reply.lower()
+        return self._summary_matcher.search(content_lower)
     
-    def check_proxy_confirmation(self, proxy_reply: str) -> bool:
+    def check_proxy_confirmation(self, proxy_reply: str, content_lower: Optional[str] = None) -> bool:
         """
         Check if proxy confirmed the summary
         
         Args:
             proxy_reply: Proxy response text
+            content_lower: proxy_reply already lowercased, if the caller has it
             
         Returns:
             True if confirmation was provided
         """
-        return any(phrase in proxy_reply.lower() for phrase in self.confirmation_phrases)
+        if content_lower is None:
+            content_lower = proxy_reply.lower()
+        return self._confirmation_matcher.search(content_lower)
     
-    def check_clarifying_question(self, proxy_reply: str) -> bool:
+    def check_clarifying_question(self, proxy_reply: str, content_lower: Optional[str] = None) -> bool:
         """
         Check if a clarifying question was asked by the proxy
         
         Args:
             proxy_reply: Proxy response text
+            content_lower: proxy_reply already lowercased, if the caller has it
         
         Returns:
             True if a clarifying question was asked
         """
-        return "can you clarify" in proxy_reply.lower()
+        if content_lower is None:
+            content_lower = proxy_reply.lower()
+        return "can you clarify" in content_lower
 
-    def check_tangent_inclusion(self, proxy_reply: str) -> bool:
+    def check_tangent_inclusion(self, proxy_reply: str, content_lower: Optional[str] = None) -> bool:
         """
         Check if a tangent was included in the proxy's response
         
         Args:
             proxy_reply: Proxy response text
+            content_lower: proxy_reply already lowercased, if the caller has it
         
         Returns:
             True if a tangent was included
         """
-        return "by the way" in proxy_reply.lower() or "anyway" in proxy_reply.lower()
+        if content_lower is None:
+            content_lower = proxy_reply.lower()
+        return self._tangent_matcher.search(content_lower)
     
-    def _analyze_persona_adherence(self, turns: List[Dict[str, Any]]) -> List[FailureDetail]:
+    def _analyze_persona_adherence(self, turn_views: List[_TurnView]) -> Tuple[List[FailureDetail], List[str]]:
         """
-        Analyze conversation for persona drift and protocol violations
+        Analyze conversation for persona drift, protocol violations and role-playing quality
         
         Args:
-            turns: List of conversation turns
+            turn_views: Conversation turns with pre-lowered content
             
         Returns:
-            List of FailureDetail objects for persona-related issues
+            Tuple of FailureDetail objects for persona-related issues and
+            role-playing success indicators, both in turn order
         """
         failures = []
-        
-        for turn_idx, turn in enumerate(turns):
-            if turn.get("role") == "user":  # Proxy responses
-                content = turn.get("content", "").lower()
+        quality_indicators = []
+        
+        for turn_idx, view in enumerate(turn_views):
+            role = view.role
+            content = view.content_lower
+            if role == "user":  # Proxy responses
+                if self._role_adherence_matcher.search(content):
+                    quality_indicators.append("role_adherence_maintained")
+                
+                if self._persona_matcher.search(content):
+                    quality_indicators.append("persona_characteristics_expressed")
                 
                 # Check for role reversal (proxy acting like recruiter)
-                recruiter_phrases = [
-                    "i can help you with", "let me ask you about", "what's your budget",
-                    "i'll need to know", "let me gather", "i'm here to help you find"
-                ]
-                if any(phrase in content for phrase in recruiter_phrases):
+                violating_phrases = self._recruiter_matcher.findall(content)
+                if violating_phrases:
                     failures.append(FailureDetail(
                         category=FailureCategory.PERSONA_DRIFT,
                         reason="Proxy user acting like recruiter instead of hiring manager",
                         turn_occurred=turn_idx + 1,
-                        context={"violating_phrases": [p for p in recruiter_phrases if p in content]}
+                        context={"violating_phrases": violating_phrases}
                     ))
                 
                 # Check for breaking character
-                breaking_character_phrases = [
-                    "i'm an ai", "as an ai", "i'm a language model", "i'm not real",
-                    "this is a simulation", "i'm programmed"
-                ]
-                if any(phrase in content for phrase in breaking_character_phrases):
+                breaking_phrases = self._breaking_character_matcher.findall(content)
+                if breaking_phrases:
                     failures.append(FailureDetail(
                         category=FailureCategory.PERSONA_DRIFT,
                         reason="Proxy broke character and revealed AI nature",
                         turn_occurred=turn_idx + 1,
-                        context={"breaking_phrases": [p for p in breaking_character_phrases if p in content]}
+                        context={"breaking_phrases": breaking_phrases}
                     ))
             
-            elif turn.get("role") == "system":  # SUT responses
-                content = turn.get("content", "").lower()
-                
-                # Check for SUT breaking protocol (asking multiple questions)
-                question_count = content.count("?")
-                if question_count > 1:
+            elif role == "system":  # SUT responses
+                # Check for SUT breaking protocol (asking multiple questions).
+                # Most replies have at most one "?", so only count after a second is found
+                first_question = content.find("?")
+                if first_question != -1 and content.find("?", first_question + 1) != -1:
+                    question_count = content.count("?", first_question)
                     failures.append(FailureDetail(
                         category=FailureCategory.PROTOCOL_VIOLATION,
                         reason=f"SUT asked {question_count} questions in one turn (should be 1)",
@@ -674,21 +954,22 @@ class ConversationAnalyzer:
                     ))
                 
                 # Check for SUT not following role guidelines
-                if "i don't know" in content or "i can't help" in content:
+                if self._sut_inability_matcher.search(content):
                     failures.append(FailureDetail(
                         category=FailureCategory.SUT_ERROR,
                         reason="SUT expressed inability to help (should maintain recruiter role)",
                         turn_occurred=turn_idx + 1
                     ))
         
-        return failures
+        return failures, quality_indicators
     
-    def _analyze_information_completeness(self, turns: List[Dict[str, Any]]) -> List[FailureDetail]:
+    def _analyze_information_completeness(self, full_conversation: str, total_turns: int) -> List[FailureDetail]:
         """
         Analyze conversation for incomplete information gathering
         
         Args:
-            turns: List of conversation turns
+            full_conversation: All turn contents joined with spaces
+            total_turns: Number of turns in the conversation
             
         Returns:
             List of FailureDetail objects for information completeness issues
@@ -696,7 +977,6 @@ class ConversationAnalyzer:
         failures = []
         
         # Check which mandatory fields were gathered
-        full_conversation = " ".join([turn.get("content", "") for turn in turns])
         extracted_fields = self._extract_all_fields(full_conversation)
         
         # Count missing mandatory fields
@@ -717,11 +997,11 @@ class ConversationAnalyzer:
             ))
         
         # Check for very short conversation (potential abandonment)
-        if len(turns) < 4:  # Less than 2 exchanges
+        if total_turns < 4:  # Less than 2 exchanges
             failures.append(FailureDetail(
                 category=FailureCategory.USER_ABANDONMENT,
-                reason=f"Conversation ended prematurely with only {len(turns)} turns",
-                context={"total_turns": len(turns)}
+                reason=f"Conversation ended prematurely with only {total_turns} turns",
+                context={"total_turns": total_turns}
             ))
         
         return failures
@@ -1,11 +1,11 @@
 """
 Data models for conversation analysis
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
 from typing import List, Dict, Any, Optional
 from enum import Enum
 
-@dataclass
+@dataclass(slots=True)
 class ConversationTurn:
     """Represents a single turn in the conversation"""
     turn: int
@@ -13,7 +13,7 @@ class ConversationTurn:
     content: str
     content_preview: str
 
-@dataclass
+@dataclass(slots=True)
 class ConversationSummary:
     """Summary of the conversation flow and quality"""
     total_turns: int
@@ -43,7 +43,7 @@ class ConversationStatus(Enum):
     TIMEOUT = "timeout"
     ERROR = "error"
 
-@dataclass
+@dataclass(slots=True)
 class FailureDetail:
     """Detailed information about a failure"""
     category: FailureCategory
@@ -52,7 +52,7 @@ class FailureDetail:
     turn_occurred: Optional[int] = None
     context: Optional[Dict[str, Any]] = None
 
-@dataclass
+@dataclass(slots=True)
 class ConversationOutcome:
     """Final outcome of the conversation"""
     status: ConversationStatus
@@ -68,7 +68,7 @@ class ConversationOutcome:
             self.failures = []
         self.total_failures = len(self.failures)
 
-@dataclass
+@dataclass(slots=True)
 class InformationGathered:
     """Structured information extracted from the conversation"""
     role_type: Optional[str] = None
@@ -76,13 +76,10 @@ class InformationGathered:
     employment_type: Optional[str] = None
     experience_level: Optional[str] = None
     salary_range: Optional[str] = None
-    skills_mentioned: List[str] = None
-    responsibilities: List[str] = None
+    skills_mentioned: List[str] = field(default_factory=list)
+    responsibilities: List[str] = field(default_factory=list)
     deadline: Optional[str] = None
-    
-    def __post_init__(self):
-        """Initialize list fields if they are None"""
-        if self.skills_mentioned is None:
-            self.skills_mentioned = []
-        if self.responsibilities is None:
-            self.responsibilities = []
+
+def field_dict(instance: Any) -> Dict[str, Any]:
+    """Shallow field-name -> value dict; the slotted models have no __dict__"""
+    return {f.name: getattr(instance, f.name) for f in fields(instance)}
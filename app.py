@@ -1,13 +1,30 @@
 # app.py
 import os
-from typing import List, Optional, Dict, Any
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel, Field
-import requests
-from dotenv import load_dotenv
-load_dotenv()
-
-# Import configuration system
+import hmac
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, AsyncIterator
+from fastapi import FastAPI, HTTPException, Request, Depends
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse, ORJSONResponse, JSONResponse
+from pydantic import BaseModel, Field, ValidationError
+import httpx
+try:
+    # orjson encodes the multi-KB system prompt several times faster than stdlib json
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+    _RESPONSE_CLASS = ORJSONResponse
+except ImportError:
+    import json
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+    _json_loads = json.loads
+    _RESPONSE_CLASS = JSONResponse
+
+# Import configuration system (loads .env and the environment file)
 from config.env_loader import load_environment_config
 from config.settings import get_settings
 
@@ -17,13 +34,37 @@ settings = get_settings()
 
 # Get API configuration based on provider setting
 API_CONFIG = settings.get_sut_api_config()
+# Request bodies are pre-encoded bytes, so the content type has to be set explicitly
+_JSON_HEADERS = {**API_CONFIG["headers"], "Content-Type": "application/json"}
+
+def _system_prompt_path(prompt_name="recruiter_v1.txt") -> str:
+    return os.path.join(os.path.dirname(__file__), "prompts", prompt_name)
 
 def load_system_prompt(prompt_name="recruiter_v1.txt"):
-    prompt_path = os.path.join(os.path.dirname(__file__), "prompts", prompt_name)
-    with open(prompt_path, "r", encoding="utf-8") as f:
+    with open(_system_prompt_path(prompt_name), "r", encoding="utf-8") as f:
         return f.read()
 
-SYSTEM_PROMPT = load_system_prompt(os.getenv("SUT_PROMPT", "recruiter_v1.txt"))
+@lru_cache(maxsize=4)
+def _build_system_message(prompt_path: str, mtime_ns: int, anthropic: bool) -> Dict[str, Any]:
+    """Build the system message; mtime_ns is part of the cache key so prompt edits are re-read"""
+    with open(prompt_path, "r", encoding="utf-8") as f:
+        system_prompt = f.read()
+    if anthropic:
+        # Anthropic models only cache blocks explicitly marked with cache_control
+        return {
+            "role": "system",
+            "content": [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+        }
+    return {"role": "system", "content": system_prompt}
+
+def system_message(anthropic: bool = False) -> Dict[str, Any]:
+    """
+    System message for the current SUT_PROMPT file, built on first use rather than at import.
+    The same object is returned for every request until the file changes, keeping the static
+    prefix byte-identical across turns so the provider's prompt cache can reuse it.
+    """
+    prompt_path = _system_prompt_path(os.getenv("SUT_PROMPT", "recruiter_v1.txt"))
+    return _build_system_message(prompt_path, os.stat(prompt_path).st_mtime_ns, anthropic)
 
 class Message(BaseModel):
     role: str
@@ -32,6 +73,7 @@ class Message(BaseModel):
 class Config(BaseModel):
     model: str = API_CONFIG.get("model", "gpt-4o-mini")
     temperature: float = 0.2
+    provider: str = "openai"  # "anthropic" marks the system prompt for prompt caching
 
 class Trace(BaseModel):
     trace_id: Optional[str] = None
@@ -42,59 +84,212 @@ class ChatRequest(BaseModel):
     config: Optional[Config] = Config()
     trace: Optional[Trace] = None
 
+# Shared secret that lets internal callers skip request validation; unset disables the fast path
+_TRUSTED_TOKEN = os.getenv("SUT_TRUSTED_TOKEN", "")
+
+def _is_trusted(request: Request) -> bool:
+    """True only when the caller presents the configured shared secret"""
+    token = request.headers.get("X-Trusted-Token")
+    return bool(_TRUSTED_TOKEN) and token is not None and hmac.compare_digest(token.encode(), _TRUSTED_TOKEN.encode())
+
+async def parse_chat_request(request: Request) -> ChatRequest:
+    """
+    Parse the /sut/chat body. Internal callers that send the SUT_TRUSTED_TOKEN secret in
+    "X-Trusted-Token" have well-typed payloads, so they skip pydantic validation.
+    """
+    body = await request.body()
+    if _is_trusted(request):
+        try:
+            data = _json_loads(body)
+            cfg = data.get("config")
+            trace = data.get("trace")
+            return ChatRequest.model_construct(
+                messages=[Message.model_construct(**m) for m in data["messages"]],
+                config=Config.model_construct(**{**Config().model_dump(), **cfg}) if cfg else Config(),
+                trace=Trace.model_construct(**trace) if trace else None
+            )
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            raise RequestValidationError([{"type": "value_error", "loc": ("body",), "msg": f"Malformed request body: {e}", "input": None}])
+    try:
+        return ChatRequest.model_validate_json(body)
+    except ValidationError as e:
+        # Same error shape FastAPI produces for a body parameter
+        raise RequestValidationError([{**err, "loc": ("body", *err["loc"])} for err in e.errors()])
+
 class ChatResponse(BaseModel):
     message: str
     meta: Dict[str, Any] = Field(default_factory=dict)
 
-app = FastAPI(title="Staffer SUT Chat API")
+# Pooled async client shared by all requests; opened and closed with the app
+http_client: Optional[httpx.AsyncClient] = None
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global http_client
+    http_client = httpx.AsyncClient(timeout=60)
+    # Read the prompt at startup so the first request does not pay for it
+    system_message()
+    try:
+        yield
+    finally:
+        await http_client.aclose()
+        http_client = None
+
+app = FastAPI(title="Staffer SUT Chat API", lifespan=lifespan, default_response_class=_RESPONSE_CLASS)
 
 @app.get("/")
 def root():
     return {"message": "Staffer SUT API is running!"}
 
-def call_llm_api(messages: List[Dict[str, str]], cfg: Config) -> Dict[str, Any]:
-    """Call the configured LLM API (OpenAI or OpenRouter)"""
-    headers = API_CONFIG["headers"]
-    payload = {
+def _build_payload(messages: List[Dict[str, str]], cfg: Config) -> Dict[str, Any]:
+    system_msg = system_message(cfg.provider == "anthropic")
+    return {
         "model": cfg.model,
         "temperature": cfg.temperature,
-        "messages": [{"role": "system", "content": SYSTEM_PROMPT}] + messages
+        "messages": [system_msg, *messages]
     }
-    r = requests.post(API_CONFIG["url"], headers=headers, json=payload, timeout=60)
+
+async def call_llm_api(messages: List[Dict[str, str]], cfg: Config) -> Dict[str, Any]:
+    """Call the configured LLM API (OpenAI or OpenRouter)"""
+    headers = _JSON_HEADERS
+    payload = _build_payload(messages, cfg)
+    r = await http_client.post(API_CONFIG["url"], headers=headers, content=_json_dumps(payload))
     if r.status_code != 200:
         raise HTTPException(status_code=502, detail=r.text)
-    return r.json()
+    return _json_loads(r.content)
 
-def naive_slot_extract(history_text: str) -> Dict[str, Any]:
+async def stream_llm_api(messages: List[Dict[str, str]], cfg: Config) -> AsyncIterator[Dict[str, Any]]:
+    """Streaming call_llm_api: yields each server-sent chunk as it arrives; the last one carries usage"""
+    payload = _build_payload(messages, cfg)
+    payload["stream"] = True
+    payload["stream_options"] = {"include_usage": True}
+    async with http_client.stream("POST", API_CONFIG["url"], headers=_JSON_HEADERS, content=_json_dumps(payload)) as r:
+        if r.status_code != 200:
+            raise HTTPException(status_code=502, detail=(await r.aread()).decode("utf-8", "replace"))
+        async for line in r.aiter_lines():
+            if not line.startswith("data: "):
+                continue
+            data = line[6:]
+            if data == "[DONE]":
+                break
+            yield _json_loads(data)
+
+# (lowercased keyword, slot, value) triples; add keywords here as the extractor grows
+_SLOT_KEYWORDS = (
+    ("senior backend engineer", "title", "Senior Backend Engineer"),
+)
+
+# Longest keyword minus one: a match can start at most this far back in already scanned text
+_SLOT_OVERLAP = max(len(keyword) for keyword, _, _ in _SLOT_KEYWORDS) - 1
+
+# Per-trace (expires_at, messages_scanned, hash of the last scanned message, scanned text tail, slots)
+# so each call only scans new messages
+_SLOT_STATE_MAX = 10_000
+_SLOT_STATE_TTL = 1800.0
+_slot_state: "OrderedDict[str, tuple[float, int, int, str, Dict[str, Any]]]" = OrderedDict()
+
+def _scan_slots(history_text: str, slots: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    if slots is None:
+        slots = {
+            "title": None,
+            "employment_type": None,
+            "work_mode": None,
+            "location": None
+        }
+    text_lower = history_text.lower()
+    for keyword, slot, value in _SLOT_KEYWORDS:
+        if keyword in text_lower:
+            slots[slot] = value
+    return slots
+
+def naive_slot_extract(history: List[str]) -> Dict[str, Any]:
     # keep simple; you can replace with a proper extractor later
+    # Messages are matched joined with " ", so a keyword split across two messages is found
+    return _scan_slots(" ".join(history))
+
+def incremental_slot_extract(trace_id: Optional[str], history: List[str]) -> Dict[str, Any]:
+    """
+    naive_slot_extract that resumes from the messages already scanned for this trace.
+    The tail of the scanned text is re-scanned with the new messages, so the result matches
+    a scan of the whole joined history.
+    """
+    if trace_id is None:
+        return naive_slot_extract(history)
+    
+    now = time.monotonic()
+    entry = _slot_state.pop(trace_id, None)
+    # Resume only if the history still holds the last scanned message at the same place;
+    # otherwise the conversation was rewound or edited, so start over
+    if (entry is not None and entry[0] >= now and 0 < entry[1] <= len(history)
+            and hash(history[entry[1] - 1]) == entry[2]):
+        _, scanned, _, tail, slots = entry
+        if scanned < len(history):
+            text = f"{tail} {' '.join(history[scanned:])}"
+            slots = _scan_slots(text, slots)
+            tail = text[-_SLOT_OVERLAP:]
+    else:
+        text = " ".join(history)
+        slots = _scan_slots(text)
+        tail = text[-_SLOT_OVERLAP:]
+    if history:
+        _slot_state[trace_id] = (now + _SLOT_STATE_TTL, len(history), hash(history[-1]), tail, slots)
+        while len(_slot_state) > _SLOT_STATE_MAX:
+            _slot_state.popitem(last=False)
+    return dict(slots)
+
+def _chat_meta(req: ChatRequest, llm_msgs: List[Dict[str, str]], usage: Dict[str, Any], finish_reason: str) -> Dict[str, Any]:
+    trace_id = req.trace.trace_id if req.trace else None
+    slots = incremental_slot_extract(trace_id, [m["content"] for m in llm_msgs])
     return {
-        "title": "Senior Backend Engineer" if "Senior Backend Engineer" in history_text else None,
-        "employment_type": None,
-        "work_mode": None,
-        "location": None
+        "tokens_prompt": usage.get("prompt_tokens"),
+        "tokens_completion": usage.get("completion_tokens"),
+        "finish_reason": finish_reason,
+        "module_hint": "role_basics",  # optional: set heuristically or via small classifier
+        "slots_extracted": slots
     }
 
 @app.post("/sut/chat", response_model=ChatResponse)
-def sut_chat(req: ChatRequest):
+async def sut_chat(req: ChatRequest = Depends(parse_chat_request)):
     # Build LLM messages
     llm_msgs = [{"role": m.role, "content": m.content} for m in req.messages]
 
-    data = call_llm_api(llm_msgs, req.config)
+    data = await call_llm_api(llm_msgs, req.config)
     choice = data["choices"][0]
     text = choice["message"]["content"]
     usage = data.get("usage", {})
 
-    full_history = " ".join([m["content"] for m in llm_msgs])
-    slots = naive_slot_extract(full_history)
-
     resp = ChatResponse(
         message=text,
-        meta={
-            "tokens_prompt": usage.get("prompt_tokens"),
-            "tokens_completion": usage.get("completion_tokens"),
-            "finish_reason": choice.get("finish_reason", "stop"),
-            "module_hint": "role_basics",  # optional: set heuristically or via small classifier
-            "slots_extracted": slots
-        }
+        meta=_chat_meta(req, llm_msgs, usage, choice.get("finish_reason", "stop"))
     )
     return resp
+
+@app.post("/sut/chat/stream")
+async def sut_chat_stream(req: ChatRequest = Depends(parse_chat_request)):
+    """
+    Streaming variant of /sut/chat. Emits server-sent events: one {"delta": ...}
+    per generated token chunk, then a final ChatResponse with the full message and meta.
+    """
+    llm_msgs = [{"role": m.role, "content": m.content} for m in req.messages]
+    chunks = stream_llm_api(llm_msgs, req.config)
+    # Pull the first chunk before responding so upstream errors still surface as a 502
+    first = await anext(chunks, None)
+
+    async def events():
+        parts = []
+        usage = {}
+        finish_reason = "stop"
+        chunk = first
+        while chunk is not None:
+            usage = chunk.get("usage") or usage
+            for choice in chunk.get("choices") or ():
+                delta = (choice.get("delta") or {}).get("content")
+                if delta:
+                    parts.append(delta)
+                    yield b"data: " + _json_dumps({"delta": delta}) + b"\n\n"
+                finish_reason = choice.get("finish_reason") or finish_reason
+            chunk = await anext(chunks, None)
+        final = ChatResponse(message="".join(parts), meta=_chat_meta(req, llm_msgs, usage, finish_reason))
+        yield b"data: " + _json_dumps(final.model_dump()) + b"\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
@@ -3,12 +3,43 @@ Environment Loader Utility
 Handles loading environment-specific configurations
 """
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 import logging
+from dotenv import load_dotenv
 
 logger = logging.getLogger(__name__)
 
+# One KEY=VALUE assignment per line; blank lines, comments and lines without '=' never match.
+# A value wrapped in matching quotes is unquoted.
+_ENV_LINE = re.compile(
+    r"""^(?![ \t]*#)[ \t]*(?P<key>[^=\n]*?)[ \t]*=[ \t]*"""
+    r"""(?:"(?P<dq>[^"\n]*)"|'(?P<sq>[^'\n]*)'|(?P<raw>[^\n]*?))[ \t]*$""",
+    re.MULTILINE
+)
+
+@lru_cache(maxsize=32)
+def _read_env_file(env_file: str, mtime_ns: int) -> Tuple[Tuple[str, str], ...]:
+    """Parse KEY=VALUE lines; mtime_ns is part of the cache key so edits are re-read"""
+    with open(env_file, 'r') as f:
+        text = f.read()
+    return tuple(
+        (m['key'], m['dq'] if m['dq'] is not None else m['sq'] if m['sq'] is not None else m['raw'])
+        for m in _ENV_LINE.finditer(text)
+    )
+
+@lru_cache(maxsize=8)
+def _list_environments(environments_dir: str, mtime_ns: int) -> Tuple[str, ...]:
+    """Sorted environment names; mtime_ns changes whenever a file is added or removed"""
+    return tuple(sorted(env_file.stem for env_file in Path(environments_dir).glob("*.env")))
+
+@lru_cache(maxsize=1)
+def _load_dotenv_once() -> None:
+    """Load .env into os.environ; it never overrides set variables, so later calls would be no-ops"""
+    load_dotenv()
+
 class EnvironmentLoader:
     """Loads environment-specific configuration files"""
     
@@ -24,15 +55,8 @@ class EnvironmentLoader:
             logger.warning(f"Environment file not found: {env_file}")
             return {}
         
-        config = {}
         try:
-            with open(env_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        config[key.strip()] = value.strip()
-            
+            config = dict(_read_env_file(str(env_file), env_file.stat().st_mtime_ns))
             logger.info(f"Loaded {len(config)} settings from {env_file}")
             return config
             
@@ -54,14 +78,12 @@ class EnvironmentLoader:
         if not self.environments_dir.exists():
             return []
         
-        env_files = []
-        for env_file in self.environments_dir.glob("*.env"):
-            env_files.append(env_file.stem)
-        
-        return sorted(env_files)
+        return list(_list_environments(str(self.environments_dir), self.environments_dir.stat().st_mtime_ns))
 
 def load_environment_config(environment: str = None) -> None:
     """Load environment configuration"""
+    # .env first: environment files never override variables that are already set
+    _load_dotenv_once()
     if environment is None:
         environment = os.getenv("ENVIRONMENT", "development")
     
@@ -4,7 +4,8 @@ Centralized settings for all environment variables and configuration
 """
 import os
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping
 from pathlib import Path
 import logging
 
@@ -37,6 +38,8 @@ class Settings:
     # Connection Pooling Settings
     pool_connections: int = 10  # Number of connection pools to cache
     pool_maxsize: int = 20  # Maximum number of connections to save in the pool
+    # Replay identical low-temperature requests from memory instead of calling the API
+    response_cache: bool = False
 
     # Simulation Behavior
     rng_seed: Optional[int] = None
@@ -93,6 +96,23 @@ class Settings:
         else:  # development
             self.debug = True
             self.log_level = "DEBUG"
+        self.refresh()
+    
+    def refresh(self) -> None:
+        """Rebuild the per-provider API config tables; call after changing api_provider or API keys"""
+        openai_config = MappingProxyType({
+            "url": "https://api.openai.com/v1/chat/completions",
+            "headers": MappingProxyType({"Authorization": f"Bearer {self.openai_api_key}"}),
+            "model": "gpt-4o-mini"
+        })
+        openrouter_config = MappingProxyType({
+            "url": "https://openrouter.ai/api/v1/chat/completions",
+            "headers": MappingProxyType({"Authorization": f"Bearer {self.openrouter_api_key}"}),
+            "model": "openai/gpt-4o-mini"  # OpenRouter model format
+        })
+        # "both" (and any unknown provider) uses OpenAI for the SUT and OpenRouter for the proxy
+        self._sut_api_configs = {"openai": openai_config, "openrouter": openrouter_config, "both": openai_config}
+        self._proxy_api_configs = {"openai": openai_config, "openrouter": openrouter_config, "both": openrouter_config}
     
     @classmethod
     def from_env(cls) -> "Settings":
@@ -123,6 +143,7 @@ class Settings:
             # Connection Pooling Settings
             pool_connections=int(os.getenv("POOL_CONNECTIONS", "10")),
             pool_maxsize=int(os.getenv("POOL_MAXSIZE", "20")),
+            response_cache=os.getenv("RESPONSE_CACHE", "false").lower() == "true",
             
             # Simulation Behavior
             rng_seed=int(os.getenv("RNG_SEED", "0")) if os.getenv("RNG_SEED") else None,
@@ -141,7 +162,8 @@ class Settings:
     def to_dict(self) -> Dict[str, Any]:
         """Convert settings to dictionary (excluding sensitive data)"""
         sensitive_fields = {"openai_api_key", "openrouter_api_key", "langfuse_public_key", "langfuse_secret_key"}
-        return {k: v for k, v in self.__dict__.items() if k not in sensitive_fields}
+        # Private attributes are derived tables that embed the API keys
+        return {k: v for k, v in self.__dict__.items() if k not in sensitive_fields and not k.startswith("_")}
     
     def get_langfuse_config(self) -> Dict[str, str]:
         """Get Langfuse configuration"""
@@ -166,47 +188,13 @@ class Settings:
             "url": self.sut_url
         }
     
-    def get_sut_api_config(self) -> Dict[str, Any]:
-        """Get SUT API configuration based on provider setting"""
-        if self.api_provider == "openai":
-            return {
-                "url": "https://api.openai.com/v1/chat/completions",
-                "headers": {"Authorization": f"Bearer {self.openai_api_key}"},
-                "model": "gpt-4o-mini"
-            }
-        elif self.api_provider == "openrouter":
-            return {
-                "url": "https://openrouter.ai/api/v1/chat/completions",
-                "headers": {"Authorization": f"Bearer {self.openrouter_api_key}"},
-                "model": "openai/gpt-4o-mini"  # OpenRouter model format
-            }
-        else:  # both - default to OpenAI for SUT
-            return {
-                "url": "https://api.openai.com/v1/chat/completions",
-                "headers": {"Authorization": f"Bearer {self.openai_api_key}"},
-                "model": "gpt-4o-mini"
-            }
+    def get_sut_api_config(self) -> Mapping[str, Any]:
+        """Get SUT API configuration based on provider setting (read-only)"""
+        return self._sut_api_configs.get(self.api_provider, self._sut_api_configs["both"])
     
-    def get_proxy_api_config(self) -> Dict[str, Any]:
-        """Get Proxy API configuration based on provider setting"""
-        if self.api_provider == "openai":
-            return {
-                "url": "https://api.openai.com/v1/chat/completions",
-                "headers": {"Authorization": f"Bearer {self.openai_api_key}"},
-                "model": "gpt-4o-mini"
-            }
-        elif self.api_provider == "openrouter":
-            return {
-                "url": "https://openrouter.ai/api/v1/chat/completions",
-                "headers": {"Authorization": f"Bearer {self.openrouter_api_key}"},
-                "model": "openai/gpt-4o-mini"  # OpenRouter model format
-            }
-        else:  # both - use OpenRouter for proxy
-            return {
-                "url": "https://openrouter.ai/api/v1/chat/completions",
-                "headers": {"Authorization": f"Bearer {self.openrouter_api_key}"},
-                "model": "openai/gpt-4o-mini"
-            }
+    def get_proxy_api_config(self) -> Mapping[str, Any]:
+        """Get Proxy API configuration based on provider setting (read-only)"""
+        return self._proxy_api_configs.get(self.api_provider, self._proxy_api_configs["both"])
 
 # Global settings instance - will be created when needed
 settings = None
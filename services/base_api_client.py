@@ -2,17 +2,48 @@
 Base API Client
 Provides common functionality for all API clients including retry logic, error handling, and logging
 """
-import time
+import atexit
 import logging
+import threading
+from urllib.parse import urlparse
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-
+from .response_cache import ExactCache
+try:
+    # orjson encodes the multi-KB prompts several times faster than stdlib json
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+    _json_loads = json.loads
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Statuses retried with backoff by the session's urllib3 Retry
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Up to this many seconds of random delay is added to each backoff so clients that
+# were throttled together do not retry in lockstep
+RETRY_BACKOFF_JITTER = 0.5
+
+# Sync sessions shared by every client with the same host and pool/retry settings, so
+# keep-alive connections (and their TLS handshakes) are reused across conversations
+_SESSIONS: Dict[tuple, requests.Session] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+@atexit.register
+def close_shared_sessions() -> None:
+    """Close every shared sync session; registered to run at interpreter exit"""
+    with _SESSIONS_LOCK:
+        for session in _SESSIONS.values():
+            session.close()
+        _SESSIONS.clear()
+
+@dataclass(slots=True, frozen=True)
 class APIClientConfig:
     """Configuration for API clients"""
     url: str
@@ -42,10 +73,26 @@ class APIRateLimitError(APIError):
 class BaseAPIClient:
     """Base class for API clients with common functionality"""
     
-    def __init__(self, config: APIClientConfig):
+    def __init__(self, config: APIClientConfig, cache: Optional[ExactCache] = None):
         self.config = config
-        self.session = self._create_session()
-        logger.debug(f"Initialized {self.__class__.__name__} with URL: {config.url}")
+        # Optional response cache; None (the default) always calls the API
+        self.cache = cache
+        # Bodies are pre-encoded bytes, so the content type has to be set explicitly
+        self._json_headers = {**config.headers, "Content-Type": "application/json"}
+        self.session = self._get_shared_session()
+        logger.debug("Initialized %s with URL: %s", self.__class__.__name__, config.url)
+    
+    def _get_shared_session(self) -> requests.Session:
+        """Return the shared session for this client's host and pool/retry settings"""
+        key = (
+            urlparse(self.config.url).netloc, self.config.max_retries, self.config.backoff_factor,
+            self.config.pool_connections, self.config.pool_maxsize, self.config.pool_block
+        )
+        with _SESSIONS_LOCK:
+            session = _SESSIONS.get(key)
+            if session is None:
+                session = _SESSIONS[key] = self._create_session()
+        return session
     
     def _create_session(self) -> requests.Session:
         """Create a requests session with optimized connection pooling and retry strategy"""
@@ -55,8 +102,12 @@ class BaseAPIClient:
         retry_strategy = Retry(
             total=self.config.max_retries,
             backoff_factor=self.config.backoff_factor,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["POST"]
+            backoff_jitter=RETRY_BACKOFF_JITTER,
+            status_forcelist=list(RETRY_STATUSES),
+            respect_retry_after_header=True,
+            allowed_methods=["POST"],
+            # Hand back the last response once retries are exhausted so it can be classified below
+            raise_on_status=False
         )
         
         # Create HTTPAdapter with connection pooling optimization
@@ -71,63 +122,72 @@ class BaseAPIClient:
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         
-        logger.debug(f"Created session with connection pool (connections: {self.config.pool_connections}, maxsize: {self.config.pool_maxsize})")
+        logger.debug("Created session with connection pool (connections: %s, maxsize: %s)", self.config.pool_connections, self.config.pool_maxsize)
         
         return session
     
     def _make_request(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Make HTTP request with error handling and retries"""
-        logger.debug(f"Making request to {self.config.url}")
-        logger.debug(f"Request payload keys: {list(payload.keys())}")
+        logger.debug("Making request to %s", self.config.url)
+        logger.debug("Request payload keys: %s", list(payload.keys()))
         
         try:
             # Use tuple for (connection_timeout, read_timeout)
             timeout_tuple = (self.config.connection_timeout, self.config.timeout)
             response = self.session.post(
                 self.config.url,
-                headers=self.config.headers,
-                json=payload,
+                headers=self._json_headers,
+                data=_json_dumps(payload),
                 timeout=timeout_tuple
             )
             
-            logger.debug(f"Response status: {response.status_code}")
+            logger.debug("Response status: %s", response.status_code)
             
-            # Handle rate limiting
-            if response.status_code == 429:
-                retry_after = response.headers.get('Retry-After', '60')
-                logger.warning(f"Rate limited. Waiting {retry_after} seconds...")
-                time.sleep(float(retry_after))
-                raise APIRateLimitError(f"Rate limited. Retry after {retry_after} seconds")
+            # The adapter already retried (honouring Retry-After); reaching here with a
+            # retryable status means the retries are exhausted
+            if response.status_code in RETRY_STATUSES:
+                retries = getattr(response.raw, "retries", None)
+                attempts = len(retries.history) if retries is not None else 0
+                logger.warning("Got %s after %d retries", response.status_code, attempts)
+                if response.status_code == 429:
+                    retry_after = response.headers.get('Retry-After', '60')
+                    raise APIRateLimitError(f"Rate limited. Retry after {retry_after} seconds")
             
             response.raise_for_status()
-            return response.json()
+            return _json_loads(response.content)
             
+        except APIError:
+            raise
         except requests.exceptions.Timeout:
-            logger.error(f"Request timeout (connection: {self.config.connection_timeout}s, read: {self.config.timeout}s)")
+            logger.error("Request timeout (connection: %ss, read: %ss)", self.config.connection_timeout, self.config.timeout)
             raise APITimeoutError(f"Request timeout (connection: {self.config.connection_timeout}s, read: {self.config.timeout}s)")
         except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed: {e}")
+            logger.error("Request failed: %s", e)
             raise APIError(f"Request failed: {e}")
         except Exception as e:
-            logger.error(f"Unexpected error: {e}")
+            logger.error("Unexpected error: %s", e)
             raise APIError(f"Unexpected error: {e}")
     
     def _extract_content(self, response_data: Dict[str, Any]) -> str:
         """Extract content from API response (to be overridden by subclasses)"""
         # Try OpenAI format first
-        if "choices" in response_data and response_data["choices"]:
+        try:
             return response_data["choices"][0]["message"]["content"]
+        except (KeyError, IndexError, TypeError):
+            pass
         
         # Try direct message format
-        if "message" in response_data:
+        try:
             return response_data["message"]
+        except (KeyError, TypeError):
+            pass
         
-        logger.error(f"Unexpected response format: {response_data}")
+        logger.error("Unexpected response format: %s", response_data)
         raise APIError("Response missing 'message' or 'choices[0][\"message\"][\"content\"]' key")
     
     def _extract_usage(self, response_data: Dict[str, Any]) -> Dict[str, Any]:
         """Extract usage data from API response"""
-        usage = response_data.get("usage", {})
+        usage = response_data.get("usage") or {}
         
         # Standardize usage format
         extracted_usage = {
@@ -136,26 +196,52 @@ class BaseAPIClient:
             "total_tokens": usage.get("total_tokens", 0)
         }
         
+        # Prompt-cache accounting: OpenAI reports cached prefix tokens under
+        # prompt_tokens_details, Anthropic reports cache reads and writes directly
+        cached_tokens = (usage.get("prompt_tokens_details") or {}).get("cached_tokens")
+        extracted_usage["cache_read_input_tokens"] = usage.get("cache_read_input_tokens", cached_tokens or 0)
+        extracted_usage["cache_creation_input_tokens"] = usage.get("cache_creation_input_tokens", 0)
+        
         # Calculate total if not provided
         if extracted_usage["total_tokens"] == 0:
             extracted_usage["total_tokens"] = extracted_usage["input_tokens"] + extracted_usage["output_tokens"]
         
-        logger.debug(f"Extracted usage: {extracted_usage}")
+        logger.debug("Extracted usage: %s", extracted_usage)
         return extracted_usage
     
+    def _cache_lookup(self, payload: Dict[str, Any]) -> tuple[Optional[bytes], Optional[tuple[str, Dict[str, Any]]]]:
+        """Return (cache key, cached response); the key is None when the payload is not cacheable"""
+        if self.cache is None or not self.cache.is_cacheable(payload):
+            return None, None
+        key = self.cache.make_key(self.config.url, payload)
+        cached = self.cache.get(key)
+        if cached is None:
+            return key, None
+        
+        logger.debug("Response cache hit for %s", self.__class__.__name__)
+        # A replayed response bills no tokens
+        return key, (cached[0], {"input_tokens": 0, "output_tokens": 0, "total_tokens": 0, "cached": True})
+    
     def send_message(self, payload: Dict[str, Any]) -> tuple[str, Dict[str, Any]]:
         """Send message and return extracted content and usage data"""
+        cache_key, cached = self._cache_lookup(payload)
+        if cached is not None:
+            return cached
+        
         response_data = self._make_request(payload)
         content = self._extract_content(response_data)
         usage = self._extract_usage(response_data)
-        logger.debug(f"Extracted content length: {len(content)}, tokens: {usage['total_tokens']}")
+        logger.debug("Extracted content length: %d, tokens: %s", len(content), usage['total_tokens'])
+        if cache_key is not None:
+            self.cache.set(cache_key, (content, usage))
         return content, usage
     
     def close(self):
-        """Close the session and cleanup connections"""
-        if hasattr(self, 'session') and self.session:
-            logger.debug(f"Closing session for {self.__class__.__name__}")
-            self.session.close()
+        """
+        No-op: the session is shared with other clients and closed at interpreter exit.
+        Kept so callers and the context manager protocol work unchanged.
+        """
+        logger.debug("Releasing shared session for %s", self.__class__.__name__)
     
     def __enter__(self):
         """Context manager entry"""
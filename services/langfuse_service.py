@@ -3,20 +3,41 @@ Langfuse Service
 Handles all Langfuse integrations including tracing, evaluations, and metadata management
 """
 import logging
+import contextlib
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 from langfuse import Langfuse
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+class _NoopSpan:
+    """Stand-in yielded by span context managers when tracing is disabled"""
+
+    def update(self, **kwargs) -> None:
+        pass
+
+_NOOP_SPAN = _NoopSpan()
+
+def _span_messages_input(messages: List[Dict[str, str]], history_offset: int) -> Dict[str, Any]:
+    """Span input holding only the messages not already attached to earlier spans"""
+    if not history_offset:
+        return {"messages": messages}
+    return {"messages": messages[history_offset:], "history_offset": history_offset}
+
+@dataclass(slots=True, frozen=True)
 class LangfuseConfig:
     """Configuration for Langfuse service"""
     public_key: str
     secret_key: str
     host: Optional[str] = None
+    # The SDK queues spans and events and exports them from a background thread;
+    # these bound how many it sends per request and how long an item may wait
+    flush_at: int = 50
+    flush_interval: float = 5.0
+    # Fraction of conversation traces the SDK keeps; sampled-out traces are dropped
+    sample_rate: float = 1.0
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ConversationMetadata:
     """Metadata for conversation tracking"""
     persona_name: str
@@ -35,8 +56,10 @@ class LangfuseService:
     
     def __init__(self, config: LangfuseConfig):
         self.config = config
+        # Without credentials every export is rejected, so skip building span payloads
+        self._enabled = bool(config.public_key and config.secret_key)
         self.client = self._initialize_client()
-        logger.info(f"Langfuse service initialized with host: {config.host or 'default'}")
+        logger.info("Langfuse service initialized with host: %s", config.host or 'default')
     
     def _initialize_client(self) -> Langfuse:
         """Initialize Langfuse client"""
@@ -44,12 +67,15 @@ class LangfuseService:
             client = Langfuse(
                 public_key=self.config.public_key,
                 secret_key=self.config.secret_key,
-                host=self.config.host
+                host=self.config.host,
+                flush_at=self.config.flush_at,
+                flush_interval=self.config.flush_interval,
+                sample_rate=self.config.sample_rate
             )
             logger.debug("Langfuse client initialized successfully")
             return client
         except Exception as e:
-            logger.error(f"Failed to initialize Langfuse client: {e}")
+            logger.error("Failed to initialize Langfuse client: %s", e)
             raise
     
     def start_conversation_trace(self, persona_name: str, scenario_title: str, 
@@ -65,7 +91,7 @@ class LangfuseService:
         Returns:
             Langfuse trace context manager
         """
-        logger.info(f"Starting conversation trace for {persona_name} - {scenario_title}")
+        logger.info("Starting conversation trace for %s - %s", persona_name, scenario_title)
         
         return self.client.start_as_current_observation(
             as_type='span',
@@ -84,27 +110,32 @@ class LangfuseService:
         """Update current trace with tags"""
         try:
             self.client.update_current_trace(tags=tags)
-            logger.debug(f"Updated trace tags: {tags}")
+            logger.debug("Updated trace tags: %s", tags)
         except Exception as e:
-            logger.warning(f"Failed to update trace tags: {e}")
+            logger.warning("Failed to update trace tags: %s", e)
     
-    def start_sut_span(self, turn_idx: int, messages: List[Dict[str, str]]) -> Any:
+    def start_sut_span(self, turn_idx: int, messages: List[Dict[str, str]],
+                       history_offset: int = 0) -> Any:
         """
         Start a SUT message span
         
         Args:
             turn_idx: Current turn index
             messages: Messages being sent to SUT
+            history_offset: Leading messages already recorded on earlier spans of
+                this trace; only messages[history_offset:] are attached
             
         Returns:
             Langfuse span context manager
         """
-        logger.debug(f"Starting SUT span for turn {turn_idx}")
+        if not self._enabled:
+            return contextlib.nullcontext(_NOOP_SPAN)
+        logger.debug("Starting SUT span for turn %d", turn_idx)
         
         return self.client.start_as_current_observation(
             as_type='span',
             name="sut_message",
-            input={"messages": messages},
+            input=_span_messages_input(messages, history_offset),
             metadata={
                 "turn": turn_idx,
                 "activity": "sut_message",
@@ -113,7 +144,7 @@ class LangfuseService:
         )
     
     def start_proxy_span(self, turn_idx: int, system_prompt: str, 
-                        messages: List[Dict[str, str]]) -> Any:
+                        messages: List[Dict[str, str]], history_offset: int = 0) -> Any:
         """
         Start a proxy message span
         
@@ -121,15 +152,19 @@ class LangfuseService:
             turn_idx: Current turn index
             system_prompt: System prompt being used
             messages: Messages being sent to proxy
+            history_offset: Leading messages already recorded on earlier spans of
+                this trace; only messages[history_offset:] are attached
             
         Returns:
             Langfuse span context manager
         """
-        logger.debug(f"Starting proxy span for turn {turn_idx}")
+        if not self._enabled:
+            return contextlib.nullcontext(_NOOP_SPAN)
+        logger.debug("Starting proxy span for turn %d", turn_idx)
         
         proxy_input = {
             "system": system_prompt,
-            "messages": messages
+            **_span_messages_input(messages, history_offset)
         }
         
         return self.client.start_as_current_observation(
@@ -177,7 +212,7 @@ class LangfuseService:
             )
             logger.info("Updated trace with final output and metadata")
         except Exception as e:
-            logger.error(f"Failed to update trace output: {e}")
+            logger.error("Failed to update trace output: %s", e)
     
     def create_evaluation_event(self, transcript: str, turns_count: int, 
                               persona_name: str, scenario_title: str,
@@ -212,7 +247,7 @@ class LangfuseService:
             )
             logger.info("Created evaluation event")
         except Exception as e:
-            logger.error(f"Failed to create evaluation event: {e}")
+            logger.error("Failed to create evaluation event: %s", e)
     
     def flush(self) -> None:
         """Flush all pending data to Langfuse"""
@@ -220,4 +255,4 @@ class LangfuseService:
             self.client.flush()
             logger.debug("Flushed data to Langfuse")
         except Exception as e:
-            logger.error(f"Failed to flush data to Langfuse: {e}")
+            logger.error("Failed to flush data to Langfuse: %s", e)
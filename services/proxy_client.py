@@ -2,28 +2,73 @@
 Proxy Client
 Handles communication with the proxy API (OpenAI/OpenRouter) for persona role-playing
 """
+import re
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from config.settings import get_settings
 from .base_api_client import BaseAPIClient, APIClientConfig
+from .response_cache import ExactCache
 
 logger = logging.getLogger(__name__)
 
+# Fields the static part of the persona system prompt is built from; the per-turn
+# controller is appended separately because it changes every turn
+_PERSONA_PROMPT_KEYS = (
+    'role_adherence', 'forbidden_behaviors', 'required_behaviors',
+    'response_formula', 'recovery_phrase', 'character_motivation'
+)
+_SCENARIO_PROMPT_KEYS = _PERSONA_PROMPT_KEYS + ('title', 'entry_context', 'interaction_contract')
+_PROMPT_CACHE_MAX = 256
+
+# First terminal punctuation mark in a reply
+_SENTENCE_END = re.compile(r'[.!?]')
+
+# Fixed rules appended after the scenario grounding block
+_SCENARIO_GROUNDING_RULES = (
+    "Respond in one natural sentence. Align with the scenario context; do not invent a different role title.\n"
+    "If greeted with 'How can I help you?', state your hiring need from the entry context succinctly.\n"
+    "Never mirror or repeat the assistant's question verbatim; answer directly and concisely."
+)
+
+def _bullet_section(heading: str, items: List[Any]) -> str:
+    """Heading line followed by one '- item' line per entry, joined in one pass"""
+    return heading + "\n- " + "\n- ".join(map(str, items))
+
+# Bullet-list behavior sections, emitted in this order for the persona and then the scenario
+_BEHAVIOR_SECTIONS = (
+    ('forbidden_behaviors', "FORBIDDEN BEHAVIORS"),
+    ('required_behaviors', "REQUIRED BEHAVIORS"),
+)
+
+def _append_behavior_sections(parts: List[str], source: Dict[str, Any], heading_suffix: str) -> None:
+    """Append a bullet section for each non-empty behavior list in source"""
+    for key, heading in _BEHAVIOR_SECTIONS:
+        items = source.get(key)
+        if items:
+            parts.append(_bullet_section(heading + heading_suffix, items))
+
 class ProxyClient(BaseAPIClient):
     """Client for interacting with proxy API for persona simulation"""
     
-    def __init__(self, config: APIClientConfig):
-        super().__init__(config)
-        logger.info(f"Proxy Client initialized for: {config.url}")
+    def __init__(self, config: APIClientConfig, cache: Optional[ExactCache] = None):
+        super().__init__(config, cache=cache)
+        # Static persona prompt keyed by the identity of the persona/scenario field values.
+        # The engine hands each turn a shallow copy of the same scenario, so the values are
+        # the same objects every turn. Entries keep the values alive so ids are not reused.
+        self._prompt_cache: Dict[tuple, tuple[tuple, str]] = {}
+        logger.info("Proxy Client initialized for: %s", config.url)
     
     def _extract_content(self, response_data: Dict[str, Any]) -> str:
         """Extract content from proxy API response"""
         # Proxy APIs should always use OpenAI format
-        if "choices" in response_data and response_data["choices"]:
+        try:
             content = response_data["choices"][0]["message"]["content"]
             logger.debug("Extracted content from proxy API response")
             return content
+        except (KeyError, IndexError, TypeError):
+            pass
         
-        logger.error(f"Proxy API response missing expected format: {response_data}")
+        logger.error("Proxy API response missing expected format: %s", response_data)
         raise ValueError("Proxy API response missing 'choices[0][\"message\"][\"content\"]' key")
     
     def _build_persona_system_prompt(self, persona: Dict[str, Any], scenario: Dict[str, Any]) -> str:
@@ -37,70 +82,75 @@ class ProxyClient(BaseAPIClient):
         Returns:
             Complete system prompt string
         """
+        values = (*map(persona.get, _PERSONA_PROMPT_KEYS), *map(scenario.get, _SCENARIO_PROMPT_KEYS))
+        key = tuple(map(id, values))
+        entry = self._prompt_cache.get(key)
+        if entry is None:
+            if len(self._prompt_cache) >= _PROMPT_CACHE_MAX:
+                self._prompt_cache.clear()
+            entry = self._prompt_cache[key] = (values, self._build_static_persona_prompt(persona, scenario))
+        static_prompt = entry[1]
+        
+        # Turn controller: per-turn gates (clarifying/tangent/cooldown/closure)
+        turn_controller = scenario.get('turn_controller')
+        if turn_controller:
+            return f"{static_prompt}\n{turn_controller}" if static_prompt else turn_controller
+        return static_prompt
+    
+    def _build_static_persona_prompt(self, persona: Dict[str, Any], scenario: Dict[str, Any]) -> str:
+        """Everything in the persona system prompt except the per-turn controller"""
+        # One entry per section; bullet lists are joined once per section
         system_parts = []
         
         # Persona role adherence
-        if persona.get('role_adherence'):
-            system_parts.append(persona['role_adherence'])
-        
-        # Forbidden behaviors
-        forbidden = persona.get('forbidden_behaviors', [])
-        if forbidden:
-            system_parts.append("FORBIDDEN BEHAVIORS:")
-            for behavior in forbidden:
-                system_parts.append(f"- {behavior}")
-        
-        # Required behaviors
-        required = persona.get('required_behaviors', [])
-        if required:
-            system_parts.append("REQUIRED BEHAVIORS:")
-            for behavior in required:
-                system_parts.append(f"- {behavior}")
+        role_adherence = persona.get('role_adherence')
+        if role_adherence:
+            system_parts.append(role_adherence)
+        
+        # Forbidden and required behaviors
+        _append_behavior_sections(system_parts, persona, ":")
         
         # Response formula
-        if persona.get('response_formula'):
-            system_parts.append(f"RESPONSE FORMULA: {persona['response_formula']}")
+        response_formula = persona.get('response_formula')
+        if response_formula:
+            system_parts.append(f"RESPONSE FORMULA: {response_formula}")
             # If persona demands single-sentence replies, add an explicit hard limit
-            if '1 sentence' in persona['response_formula'].lower() or 'one sentence' in persona['response_formula'].lower():
+            formula_lower = response_formula.lower()
+            if '1 sentence' in formula_lower or 'one sentence' in formula_lower:
                 system_parts.append("HARD LIMIT: Your replies MUST be a single sentence only. No multi-part answers.")
         
         # Recovery phrase
-        if persona.get('recovery_phrase'):
-            system_parts.append(f"RECOVERY PHRASE: {persona['recovery_phrase']}")
+        recovery_phrase = persona.get('recovery_phrase')
+        if recovery_phrase:
+            system_parts.append(f"RECOVERY PHRASE: {recovery_phrase}")
         
         # Character motivation
-        if persona.get('character_motivation'):
-            system_parts.append(f"CHARACTER MOTIVATION: {persona['character_motivation']}")
+        motivation = persona.get('character_motivation')
+        if motivation:
+            system_parts.append(f"CHARACTER MOTIVATION: {motivation}")
         
         # Scenario-specific instructions
-        if scenario.get('role_adherence'):
-            system_parts.append(scenario['role_adherence'])
-        
-        # Scenario forbidden behaviors
-        scenario_forbidden = scenario.get('forbidden_behaviors', [])
-        if scenario_forbidden:
-            system_parts.append("FORBIDDEN BEHAVIORS (scenario):")
-            for behavior in scenario_forbidden:
-                system_parts.append(f"- {behavior}")
-        
-        # Scenario required behaviors
-        scenario_required = scenario.get('required_behaviors', [])
-        if scenario_required:
-            system_parts.append("REQUIRED BEHAVIORS (scenario):")
-            for behavior in scenario_required:
-                system_parts.append(f"- {behavior}")
+        scenario_role_adherence = scenario.get('role_adherence')
+        if scenario_role_adherence:
+            system_parts.append(scenario_role_adherence)
+        
+        # Scenario forbidden and required behaviors
+        _append_behavior_sections(system_parts, scenario, " (scenario):")
         
         # Scenario response formula (only if persona hasn't defined one to avoid conflicts)
-        if scenario.get('response_formula') and not persona.get('response_formula'):
-            system_parts.append(f"RESPONSE FORMULA (scenario): {scenario['response_formula']}")
+        scenario_formula = scenario.get('response_formula')
+        if scenario_formula and not response_formula:
+            system_parts.append(f"RESPONSE FORMULA (scenario): {scenario_formula}")
         
         # Scenario recovery phrase — suppress if persona already defines one
-        if scenario.get('recovery_phrase') and not persona.get('recovery_phrase'):
-            system_parts.append(f"RECOVERY PHRASE (scenario): {scenario['recovery_phrase']}")
+        scenario_recovery = scenario.get('recovery_phrase')
+        if scenario_recovery and not recovery_phrase:
+            system_parts.append(f"RECOVERY PHRASE (scenario): {scenario_recovery}")
         
         # Scenario character motivation
-        if scenario.get('character_motivation'):
-            system_parts.append(f"CHARACTER MOTIVATION (scenario): {scenario['character_motivation']}")
+        scenario_motivation = scenario.get('character_motivation')
+        if scenario_motivation:
+            system_parts.append(f"CHARACTER MOTIVATION (scenario): {scenario_motivation}")
 
         # Scenario grounding: title and entry context to avoid drift
         title = scenario.get('title')
@@ -112,25 +162,12 @@ class ProxyClient(BaseAPIClient):
             if entry:
                 system_parts.append(f"- Entry context: {entry.strip()}")
             # Explicit constraint to prevent role drift
-            system_parts.append(
-                "Respond in one natural sentence. Align with the scenario context; do not invent a different role title."
-            )
-            system_parts.append(
-                "If greeted with 'How can I help you?', state your hiring need from the entry context succinctly."
-            )
-            system_parts.append(
-                "Never mirror or repeat the assistant's question verbatim; answer directly and concisely."
-            )
+            system_parts.append(_SCENARIO_GROUNDING_RULES)
 
         # Interaction contract: engine-computed runtime rules and dials
         contract = scenario.get('interaction_contract')
         if contract:
             system_parts.append(contract)
-
-        # Turn controller: per-turn gates (clarifying/tangent/cooldown/closure)
-        turn_controller = scenario.get('turn_controller')
-        if turn_controller:
-            system_parts.append(turn_controller)
         
         return "\n".join(system_parts)
     
@@ -147,25 +184,32 @@ class ProxyClient(BaseAPIClient):
         Returns:
             Tuple of (Persona response content, usage data)
         """
+        payload = self._build_persona_payload(persona, scenario, messages)
+        try:
+            response, usage = self.send_message(payload)
+            logger.info("Persona response received (length: %d, tokens: %s)", len(response), usage['total_tokens'])
+            return response, usage
+        except Exception as e:
+            logger.error("Proxy request failed: %s", e)
+            raise
+    
+    def _build_persona_payload(self, persona: Dict[str, Any], scenario: Dict[str, Any],
+                               messages: List[Dict[str, str]]) -> Dict[str, Any]:
+        """Build the proxy API payload for one persona turn"""
         # Build system prompt from persona and scenario only
         system_prompt = self._build_persona_system_prompt(persona, scenario)
         
-        # Defense-in-depth: ensure we only send ONE system message total
-        cleaned_messages = [m for m in messages if m.get("role") != "system"]
-        
-        # Capture last assistant message for anti-echo sanitization
-        last_assistant = None
-        for m in reversed(cleaned_messages):
-            if m.get("role") == "assistant":
-                last_assistant = (m.get("content") or "").strip()
-                break
+        # Defense-in-depth: ensure we only send ONE system message total. The engine never
+        # sends one, so only copy the history when there is something to drop.
+        if any(m.get("role") == "system" for m in messages):
+            cleaned_messages = [m for m in messages if m.get("role") != "system"]
+        else:
+            cleaned_messages = messages
         
         # Prepare payload for proxy API
         payload = {
             "model": self.config.model or "gpt-4o-mini",
-            "messages": [
-                {"role": "system", "content": system_prompt}
-            ] + cleaned_messages
+            "messages": [{"role": "system", "content": system_prompt}, *cleaned_messages]
         }
 
         # Sampling controls (temperature/top_p): prefer scenario overrides, then settings/env
@@ -177,7 +221,6 @@ class ProxyClient(BaseAPIClient):
             if top_p_override is not None:
                 payload["top_p"] = float(top_p_override)
             if temp_override is None or top_p_override is None:
-                from config.settings import get_settings
                 settings = get_settings()
                 if temp_override is None:
                     payload["temperature"] = settings.temperature
@@ -186,17 +229,10 @@ class ProxyClient(BaseAPIClient):
         except Exception:
             pass
         
-        logger.info(f"Sending persona message through proxy API with {len(messages)} messages")
-        logger.debug(f"System prompt length: {len(system_prompt)}")
-        logger.debug(f"Proxy payload keys: {list(payload.keys())}")
-        
-        try:
-            response, usage = self.send_message(payload)
-            logger.info(f"Persona response received (length: {len(response)}, tokens: {usage['total_tokens']})")
-            return response, usage
-        except Exception as e:
-            logger.error(f"Proxy request failed: {e}")
-            raise
+        logger.info("Sending persona message through proxy API with %d messages", len(messages))
+        logger.debug("System prompt length: %d", len(system_prompt))
+        logger.debug("Proxy payload keys: %s", list(payload.keys()))
+        return payload
 
 
     def _enforce_single_sentence(self, text: str) -> str:
@@ -204,15 +240,9 @@ class ProxyClient(BaseAPIClient):
         s = text.strip()
         if not s:
             return s
-        # Find first terminal punctuation. Prefer '?', '!' or '.'
-        first_q = s.find('?') if '?' in s else -1
-        first_e = s.find('!') if '!' in s else -1
-        first_p = s.find('.') if '.' in s else -1
-
-        candidates = [idx for idx in [first_q, first_e, first_p] if idx != -1]
-        if not candidates:
+        # Cut after the first terminal punctuation: '?', '!' or '.'
+        match = _SENTENCE_END.search(s)
+        if match is None:
             # No clear sentence boundary; return as-is but cap length
             return s[:240]
-        end = min(candidates)
-        single = s[: end + 1].strip()
-        return single
+        return s[:match.end()].strip()
@@ -0,0 +1,82 @@
+"""
+Response Cache
+Exact-match cache for API responses, keyed on the normalized request payload
+"""
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+try:
+    # Keys hash the whole message history, so encoding speed matters on every lookup
+    import orjson
+    def _canonical_json(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+except ImportError:
+    import json
+    def _canonical_json(obj: Any) -> bytes:
+        return json.dumps(obj, sort_keys=True, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+logger = logging.getLogger(__name__)
+
+# Above this temperature responses are too varied to be worth replaying
+MAX_CACHEABLE_TEMPERATURE = 0.3
+
+class ExactCache:
+    """
+    LRU cache of (content, usage) responses with a per-entry time-to-live.
+
+    Keys are a blake2b digest of the request URL and the JSON payload with
+    sorted keys, so dict ordering never causes a miss. Safe to share between
+    threads.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[bytes, Tuple[float, Tuple[str, Dict[str, Any]]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def is_cacheable(payload: Dict[str, Any]) -> bool:
+        """Only near-deterministic, tool-free requests are cached"""
+        if "tools" in payload or "tool_choice" in payload:
+            return False
+        return float(payload.get("temperature", 1.0)) <= MAX_CACHEABLE_TEMPERATURE
+
+    @staticmethod
+    def make_key(url: str, payload: Dict[str, Any]) -> bytes:
+        """Hash the endpoint and normalized payload into a cache key"""
+        return hashlib.blake2b(_canonical_json([url, payload]), digest_size=16).digest()
+
+    def get(self, key: bytes) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Return the cached (content, usage) for key, or None on miss or expiry"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            content, usage = entry[1]
+            return content, dict(usage)
+
+    def set(self, key: bytes, value: Tuple[str, Dict[str, Any]]) -> None:
+        """Store (content, usage) under key, evicting the least recently used entry"""
+        content, usage = value
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, (content, dict(usage)))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries"""
+        with self._lock:
+            self._entries.clear()
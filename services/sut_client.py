@@ -3,69 +3,96 @@ SUT (System Under Test) Client
 Handles communication with the Staffer chat endpoint
 """
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from config.settings import get_settings
 from .base_api_client import BaseAPIClient, APIClientConfig
+from .response_cache import ExactCache
 
 logger = logging.getLogger(__name__)
 
+def _get_sampling_defaults() -> tuple[float, float]:
+    """(temperature, top_p) from the current settings; read on every call so refreshed settings apply"""
+    try:
+        settings = get_settings()
+        return float(settings.temperature), float(settings.top_p)
+    except Exception:
+        # Settings unavailable (e.g. missing env)
+        return 0.7, 1.0
+
 class SUTClient(BaseAPIClient):
     """Client for interacting with the Staffer SUT endpoint"""
     
-    def __init__(self, config: APIClientConfig):
-        super().__init__(config)
-        logger.info(f"SUT Client initialized for: {config.url}")
+    def __init__(self, config: APIClientConfig, cache: Optional[ExactCache] = None):
+        super().__init__(config, cache=cache)
+        logger.info("SUT Client initialized for: %s", config.url)
     
     def _extract_content(self, response_data: Dict[str, Any]) -> str:
         """Extract content from SUT API response"""
         # Try OpenAI format first (for when SUT uses OpenAI API)
-        if "choices" in response_data and response_data["choices"]:
+        try:
             content = response_data["choices"][0]["message"]["content"]
             logger.debug("Extracted content from OpenAI format")
             return content
+        except (KeyError, IndexError, TypeError):
+            pass
         
         # Try direct message format (for custom SUT API)
-        if "message" in response_data:
+        try:
             content = response_data["message"]
             logger.debug("Extracted content from direct message format")
             return content
+        except (KeyError, TypeError):
+            pass
         
-        logger.error(f"SUT response missing expected keys: {response_data}")
+        logger.error("SUT response missing expected keys: %s", response_data)
         raise ValueError("SUT response missing 'message' or 'choices[0][\"message\"][\"content\"]' key")
     
-    def send_conversation(self, messages: List[Dict[str, str]], temperature: float | None = None, top_p: float | None = None) -> tuple[str, Dict[str, Any]]:
+    def send_conversation(self, messages: List[Dict[str, str]], temperature: float | None = None, top_p: float | None = None,
+                          *, system_prompt: str | None = None) -> tuple[str, Dict[str, Any]]:
         """
         Send conversation to SUT endpoint
         
         Args:
             messages: List of conversation messages in OpenAI format
+            system_prompt: Optional system prompt to prepend
             
         Returns:
             Tuple of (SUT response content, usage data)
         """
-        # Prepare payload for SUT endpoint
+        payload = self._build_conversation_payload(messages, temperature, top_p, system_prompt)
+        try:
+            response, usage = self.send_message(payload)
+            logger.info("SUT response received (length: %d, tokens: %s)", len(response), usage['total_tokens'])
+            return response, usage
+        except Exception as e:
+            logger.error("SUT request failed: %s", e)
+            raise
+    
+    def _build_conversation_payload(self, messages: List[Dict[str, str]], temperature: float | None, top_p: float | None,
+                                    system_prompt: str | None = None) -> Dict[str, Any]:
+        """Build the SUT payload, filling sampling controls from settings when not given"""
+        # Prepare payload for SUT endpoint; the history is only serialized, so it is
+        # referenced directly unless a system prompt has to be prepended
+        if system_prompt is not None:
+            messages = [{"role": "system", "content": system_prompt}, *messages]
         payload = {"messages": messages}
         
         # Add model if configured (for OpenRouter/OpenAI APIs)
         if self.config.model:
             payload["model"] = self.config.model
         # Optional sampling controls; CLI/env overrides take precedence
-        if temperature is None:
-            temperature = self._get_temperature_default()
-        if top_p is None:
-            top_p = self._get_top_p_default()
+        if temperature is None or top_p is None:
+            default_temperature, default_top_p = _get_sampling_defaults()
+            if temperature is None:
+                temperature = default_temperature
+            if top_p is None:
+                top_p = default_top_p
         payload["temperature"] = float(temperature)
         payload["top_p"] = float(top_p)
         
-        logger.info(f"Sending conversation to SUT with {len(messages)} messages")
-        logger.debug(f"SUT payload: {payload}")
-        
-        try:
-            response, usage = self.send_message(payload)
-            logger.info(f"SUT response received (length: {len(response)}, tokens: {usage['total_tokens']})")
-            return response, usage
-        except Exception as e:
-            logger.error(f"SUT request failed: {e}")
-            raise
+        logger.info("Sending conversation to SUT with %d messages", len(messages))
+        logger.debug("SUT payload: %s", payload)
+        return payload
     
     def send_with_system_prompt(self, messages: List[Dict[str, str]], system_prompt: str, temperature: float | None = None, top_p: float | None = None) -> tuple[str, Dict[str, Any]]:
         """
@@ -78,24 +105,5 @@ class SUTClient(BaseAPIClient):
         Returns:
             Tuple of (SUT response content, usage data)
         """
-        # Prepend system prompt to messages
-        messages_with_system = [
-            {"role": "system", "content": system_prompt}
-        ] + messages
-        
-        return self.send_conversation(messages_with_system, temperature=temperature, top_p=top_p)
-
-    def _get_temperature_default(self) -> float:
-        # Pull from env-driven settings if present via headers; fallback default 0.7
-        try:
-            from config.settings import get_settings
-            return float(get_settings().temperature)
-        except Exception:
-            return 0.7
+        return self.send_conversation(messages, temperature=temperature, top_p=top_p, system_prompt=system_prompt)
 
-    def _get_top_p_default(self) -> float:
-        try:
-            from config.settings import get_settings
-            return float(get_settings().top_p)
-        except Exception:
-            return 1.0
@@ -5,46 +5,111 @@ Refactored to use modular architecture with proper separation of concerns
 Enhanced with robust validation, structured errors, and CI-friendly behavior
 """
 import yaml
+import pickle
+import hashlib
 import argparse
 import logging
+import logging.config
 import sys
 import os
+import stat
 import time
 import tempfile
 import shutil
+import contextlib
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple
-from dotenv import load_dotenv
 
-# Load .env file first
-load_dotenv()
+# The configuration system and simulation engine are imported inside simulate() so
+# --help and argument errors exit without loading the HTTP and tracing clients.
+# SIMULATE_EAGER_IMPORTS=1 imports them here instead, so profiles show the full startup cost
+if os.getenv("SIMULATE_EAGER_IMPORTS") == "1":
+    import config.env_loader, config.settings, simulation.engine_pool, simulation.simulation_engine  # noqa: F401
+
+# libyaml-backed loader when PyYAML was built with it; same safe semantics, much faster
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+### ---------- Parsed YAML Cache ----------
+def _yaml_cache_dir() -> Optional[Path]:
+    """Private per-user cache directory, or None if it cannot be trusted"""
+    base = Path(os.getenv("YAML_CACHE_DIR") or tempfile.gettempdir())
+    uid = os.getuid() if hasattr(os, "getuid") else None
+    cache_dir = base / ("staffer_sims_yaml_cache" if uid is None else f"staffer_sims_yaml_cache_{uid}")
+    try:
+        cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        st = cache_dir.stat()
+    except OSError:
+        return None
+    # Unpickling runs code: only trust a directory that nobody else can write to
+    if uid is not None and (st.st_uid != uid or st.st_mode & 0o022):
+        return None
+    return cache_dir
+
+def load_yaml_cached(file_path: str) -> Any:
+    """
+    Parse a YAML file, reusing a pickled copy from a previous run when the file is unchanged.
+
+    Cache entries are keyed by the absolute path and validated against the file's
+    mtime and size; any cache problem falls back to parsing the YAML.
+    """
+    source = Path(file_path).resolve()
+    st = source.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cache_dir = _yaml_cache_dir()
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = cache_dir / (hashlib.blake2b(str(source).encode("utf-8"), digest_size=16).hexdigest() + ".pkl")
+        try:
+            with open(cache_path, "rb") as f:
+                cached_stamp, content = pickle.load(f)
+            if cached_stamp == stamp:
+                return content
+        except Exception:
+            pass
 
-# Import our configuration system
-from config.env_loader import load_environment_config
-from config.settings import get_settings
+    # Binary stream: libyaml decodes UTF-8 itself, without an intermediate str
+    with open(source, "rb") as f:
+        content = yaml.load(f, Loader=_YAML_LOADER)
 
-# Import our new modular components
-from simulation.simulation_engine import SimulationEngine
+    if cache_path is not None:
+        temp_path = None
+        try:
+            temp_fd, temp_path = tempfile.mkstemp(suffix=".pkl", dir=cache_dir)
+            with os.fdopen(temp_fd, "wb") as f:
+                pickle.dump((stamp, content), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, cache_path)
+        except Exception:
+            if temp_path is not None:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+    return content
 
 ### ---------- Validation Functions ----------
 def validate_file_exists(file_path: str, file_type: str) -> None:
     """Validate that a file exists and is readable"""
-    path = Path(file_path)
-    if not path.exists():
+    # One stat answers both existence and file type
+    try:
+        mode = os.stat(file_path).st_mode
+    except FileNotFoundError:
         print(f"❌ Error: {file_type} file not found: {file_path}", file=sys.stderr)
         sys.exit(1)
-    if not path.is_file():
+    except (OSError, ValueError) as e:
+        # e.g. permission denied on a parent directory; report the real cause
+        print(f"❌ Error: cannot access {file_type} file {file_path}: {e}", file=sys.stderr)
+        sys.exit(1)
+    if not stat.S_ISREG(mode):
         print(f"❌ Error: {file_type} path is not a file: {file_path}", file=sys.stderr)
         sys.exit(1)
-    if not os.access(path, os.R_OK):
+    if not os.access(file_path, os.R_OK):
         print(f"❌ Error: {file_type} file is not readable: {file_path}", file=sys.stderr)
         sys.exit(1)
 
 def validate_yaml_file(file_path: str, file_type: str) -> Dict[str, Any]:
     """Validate and load YAML file with clear error messages"""
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = yaml.safe_load(f)
+        content = load_yaml_cached(file_path)
         if content is None:
             print(f"❌ Error: {file_type} file is empty or contains no valid YAML: {file_path}", file=sys.stderr)
             sys.exit(1)
@@ -71,6 +136,35 @@ def validate_positive_integer(value: int, param_name: str) -> None:
         print(f"❌ Error: {param_name} must be a positive integer, got {value}", file=sys.stderr)
         sys.exit(1)
 
+# (argument, display name, inclusive range); no range means a positive integer.
+# Checked in this order, so the first invalid argument is the one reported.
+_NUMERIC_ARG_CHECKS = (
+    ('seed', "Seed", None),
+    ('temperature', "Temperature", (0.0, 2.0)),
+    ('top_p', "Top-P", (0.0, 1.0)),
+    ('timeout', "Timeout", None),
+    ('max_retries', "Max retries", None),
+    ('retry_delay', "Retry delay", (0.1, 60.0)),
+)
+
+# CLI arguments copied into the scenario, converted to the type the engine expects
+_SCENARIO_ARG_OVERRIDES = (
+    ('temperature', 'temperature_override', float),
+    ('top_p', 'top_p_override', float),
+    ('timeout', 'conversation_timeout', int),
+)
+
+def validate_numeric_args(args) -> None:
+    """Validate every numeric CLI argument that was provided"""
+    for arg_name, display_name, bounds in _NUMERIC_ARG_CHECKS:
+        value = getattr(args, arg_name, None)
+        if value is None:
+            continue
+        if bounds is None:
+            validate_positive_integer(value, display_name)
+        else:
+            validate_numeric_range(value, display_name, *bounds)
+
 def validate_persona_structure(persona: Dict[str, Any]) -> None:
     """Validate that persona has required fields"""
     required_fields = ["name"]
@@ -87,25 +181,37 @@ def validate_scenario_structure(scenario: Dict[str, Any]) -> None:
             print(f"❌ Error: Scenario file missing required field '{field}'", file=sys.stderr)
             sys.exit(1)
 
+# Level logging was last configured with; repeated simulate() calls in one process
+# reuse the existing handlers instead of rebuilding them
+_logging_configured_level: Optional[str] = None
+
 def setup_structured_logging(settings) -> logging.Logger:
     """Setup structured logging with appropriate levels"""
-    # Configure logging format for structured output
-    log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    global _logging_configured_level
+    if _logging_configured_level == settings.log_level:
+        return logging.getLogger(__name__)
     
-    logging.basicConfig(
-        level=getattr(logging, settings.log_level),
-        format=log_format,
-        force=True  # Override any existing configuration
-    )
+    # Configure logging format for structured output; replaces any existing root handlers
+    logging.config.dictConfig({
+        "version": 1,
+        "disable_existing_loggers": False,
+        "formatters": {
+            "structured": {"format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s"}
+        },
+        "handlers": {
+            "stderr": {"class": "logging.StreamHandler", "formatter": "structured"}
+        },
+        "root": {"level": settings.log_level, "handlers": ["stderr"]},
+        # Set specific loggers to appropriate levels
+        "loggers": {
+            "simulation": {"level": "INFO"},
+            "services": {"level": "INFO"},
+            "analysis": {"level": "INFO"},
+        },
+    })
+    _logging_configured_level = settings.log_level
     
-    logger = logging.getLogger(__name__)
-    
-    # Set specific loggers to appropriate levels
-    logging.getLogger("simulation").setLevel(logging.INFO)
-    logging.getLogger("services").setLevel(logging.INFO)
-    logging.getLogger("analysis").setLevel(logging.INFO)
-    
-    return logger
+    return logging.getLogger(__name__)
 
 ### ---------- Retry and Backoff Functions ----------
 def is_transient_error(exception: Exception) -> bool:
@@ -263,7 +369,10 @@ def run_simulation_with_retry(engine, persona: Dict[str, Any], scenario: Dict[st
 def simulate(args):
     """Run a persona simulation with the given arguments"""
     try:
-        # Load environment configuration
+        from config.env_loader import load_environment_config
+        from config.settings import get_settings
+
+        # Load .env (once per process) and the environment file
         load_environment_config()
         
         # Get settings instance
@@ -290,7 +399,8 @@ def simulate(args):
         logger.info(f"Controller enabled: {args.use_controller}")
         
         # Log detailed configuration at DEBUG level
-        logger.debug(f"Full configuration: {settings.to_dict()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Full configuration: %s", settings.to_dict())
         
         # Validate file existence and load configurations
         validate_file_exists(args.persona, "Persona")
@@ -306,34 +416,27 @@ def simulate(args):
         validate_scenario_structure(scenario)
         
         # Validate numeric parameters
-        if hasattr(args, 'seed') and args.seed is not None:
-            validate_positive_integer(args.seed, "Seed")
-        
-        if hasattr(args, 'temperature') and args.temperature is not None:
-            validate_numeric_range(args.temperature, "Temperature", 0.0, 2.0)
-        
-        if hasattr(args, 'top_p') and args.top_p is not None:
-            validate_numeric_range(args.top_p, "Top-P", 0.0, 1.0)
-        
-        if hasattr(args, 'timeout') and args.timeout is not None:
-            validate_positive_integer(args.timeout, "Timeout")
-        
-        if hasattr(args, 'max_retries') and args.max_retries is not None:
-            validate_positive_integer(args.max_retries, "Max retries")
-        
-        if hasattr(args, 'retry_delay') and args.retry_delay is not None:
-            validate_numeric_range(args.retry_delay, "Retry delay", 0.1, 60.0)
+        validate_numeric_args(args)
         
         # Log payload summaries at DEBUG level (keys only for security)
-        logger.debug(f"Persona keys: {list(persona.keys())}")
-        logger.debug(f"Scenario keys: {list(scenario.keys())}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Persona keys: %s", list(persona))
+            logger.debug("Scenario keys: %s", list(scenario))
         
-        # Prepare scenario with controller toggle
+        # Copy once so CLI overrides below never touch the loaded scenario
         scenario = dict(scenario)
         scenario['use_controller'] = args.use_controller
         
         # Initialize simulation engine with context manager for proper cleanup
-        with SimulationEngine(settings, sut_prompt_path=args.sut_prompt) as engine:
+        # SIMULATE_REUSE_ENGINE keeps one engine per settings/prompt for callers that run
+        # simulate() repeatedly in one process; its sessions are closed at exit
+        if os.getenv("SIMULATE_REUSE_ENGINE"):
+            from simulation.engine_pool import get_engine
+            engine_context = contextlib.nullcontext(get_engine(settings, args.sut_prompt))
+        else:
+            from simulation.simulation_engine import SimulationEngine
+            engine_context = SimulationEngine(settings, sut_prompt_path=args.sut_prompt)
+        with engine_context as engine:
             # After initializing engine and before running simulation, check args.save_transcript
             # Pass this flag down to engine.run_simulation or wherever transcript saving occurs
             if args.save_transcript:
@@ -348,22 +451,15 @@ def simulate(args):
             
             # Inject RNG seed override if provided via CLI or env-backed settings
             if getattr(args, 'seed', None) is not None:
-                scenario = dict(scenario)
                 scenario['rng_seed_override'] = int(args.seed)
             elif settings.rng_seed is not None:
-                scenario = dict(scenario)
                 scenario['rng_seed_override'] = int(settings.rng_seed)
 
             # Allow temperature/top_p/timeout overrides
-            if getattr(args, 'temperature', None) is not None:
-                scenario = dict(scenario)
-                scenario['temperature_override'] = float(args.temperature)
-            if getattr(args, 'top_p', None) is not None:
-                scenario = dict(scenario)
-                scenario['top_p_override'] = float(args.top_p)
-            if getattr(args, 'timeout', None) is not None:
-                scenario = dict(scenario)
-                scenario['conversation_timeout'] = int(args.timeout)
+            for arg_name, scenario_key, cast in _SCENARIO_ARG_OVERRIDES:
+                value = getattr(args, arg_name, None)
+                if value is not None:
+                    scenario[scenario_key] = cast(value)
 
             # Enable deterministic mode automatically when sampling is fixed (temp=0.0, top_p=1.0)
             deterministic_mode = False
@@ -385,38 +481,41 @@ def simulate(args):
             logger.info(f"Transcript saved: {results['transcript_path']}")
             logger.info(f"JSONL saved: {results['jsonl_path']}")
             
-            # Print results summary
-            print(f"Saved: {results['transcript_path']}")
-            print(f"Saved: {results['jsonl_path']}")
+            # Build the results summary and write it to stdout in one call
+            summary_lines = [
+                f"Saved: {results['transcript_path']}",
+                f"Saved: {results['jsonl_path']}",
+            ]
             timeout_info = f" - TIMEOUT REACHED" if results.get('timeout_reached', False) else ""
-            print(f"Conversation Outcome: {results['final_outcome']['status']} (Level: {results['final_outcome']['completion_level']}%)")
-            print(f"Conversation Duration: {results.get('elapsed_time', 0):.1f}s / {results.get('timeout_limit', 120)}s{timeout_info}")
+            summary_lines.append(f"Conversation Outcome: {results['final_outcome']['status']} (Level: {results['final_outcome']['completion_level']}%)")
+            summary_lines.append(f"Conversation Duration: {results.get('elapsed_time', 0):.1f}s / {results.get('timeout_limit', 120)}s{timeout_info}")
             
-            # Print failure information if any
+            # Failure information if any
             failures = results['final_outcome'].get('failures', [])
             total_failures = results['final_outcome'].get('total_failures', 0)
             if total_failures > 0:
-                print(f"⚠️  Failures Detected: {total_failures} total")
+                summary_lines.append(f"⚠️  Failures Detected: {total_failures} total")
                 logger.warning(f"Simulation completed with {total_failures} failures")
                 for failure in failures[:3]:  # Show first 3 failures
                     turn_info = f" (turn {get_failure_attr(failure, 'turn_occurred', None)})" if get_failure_attr(failure, 'turn_occurred', None) else ""
-                    print(f"   • {get_failure_attr(failure, 'category', 'N/A')}: {get_failure_attr(failure, 'reason', 'N/A')}{turn_info}")
+                    summary_lines.append(f"   • {get_failure_attr(failure, 'category', 'N/A')}: {get_failure_attr(failure, 'reason', 'N/A')}{turn_info}")
                 if len(failures) > 3:
-                    print(f"   • ... and {len(failures) - 3} more failures")
+                    summary_lines.append(f"   • ... and {len(failures) - 3} more failures")
             
-            # Print sampling parameters
+            # Sampling parameters
             sampling = results.get('sampling_parameters', {})
-            print(f"Sampling Parameters: Seed={sampling.get('random_seed', 'auto')}, Temp={sampling.get('temperature', 'default')}, Top-P={sampling.get('top_p', 'default')}")
+            summary_lines.append(f"Sampling Parameters: Seed={sampling.get('random_seed', 'auto')}, Temp={sampling.get('temperature', 'default')}, Top-P={sampling.get('top_p', 'default')}")
             
             info = results['information_gathered']
-            print(f"Information Gathered: {len(info['skills_mentioned'])} skills, Role: {info['role_type']}, Location: {info['location']}")
+            summary_lines.append(f"Information Gathered: {len(info['skills_mentioned'])} skills, Role: {info['role_type']}, Location: {info['location']}")
             
-            # Print usage and cost information
+            # Usage and cost information
             usage = results.get('usage_stats', {})
-            print(f"API Usage: {usage.get('total_tokens', 0)} tokens ({usage.get('sut_calls', 0)} SUT + {usage.get('proxy_calls', 0)} Proxy calls)")
-            print(f"Estimated Cost: ${usage.get('estimated_cost', 0):.6f}")
+            summary_lines.append(f"API Usage: {usage.get('total_tokens', 0)} tokens ({usage.get('sut_calls', 0)} SUT + {usage.get('proxy_calls', 0)} Proxy calls)")
+            summary_lines.append(f"Estimated Cost: ${usage.get('estimated_cost', 0):.6f}")
             
-            print("Evaluations: Sent to Langfuse for processing")
+            summary_lines.append("Evaluations: Sent to Langfuse for processing")
+            print("\n".join(summary_lines))
             logger.info("Simulation completed successfully")
 
             # Emit one-line RUN_SUMMARY_JSON for external parsers (success)
@@ -4,5 +4,6 @@ Contains the main simulation engine and related logic
 """
 
 from .simulation_engine import SimulationEngine
+from .engine_pool import get_engine, clear_engines
 
-__all__ = ["SimulationEngine"]
+__all__ = ["SimulationEngine", "get_engine", "clear_engines"]
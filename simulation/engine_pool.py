@@ -0,0 +1,46 @@
+"""
+Engine Pool
+Reuses SimulationEngine instances across sequential runs in one process
+"""
+import logging
+import threading
+from collections import OrderedDict
+from typing import Tuple
+
+from config.settings import Settings
+from .simulation_engine import SimulationEngine
+
+logger = logging.getLogger(__name__)
+
+# Distinct (settings, SUT prompt) combinations kept alive at once
+_MAX_ENGINES = 4
+
+_engines: "OrderedDict[Tuple[int, str], SimulationEngine]" = OrderedDict()
+_engines_lock = threading.Lock()
+
+def get_engine(settings: Settings, sut_prompt_path: str = "prompts/recruiter_v1.txt") -> SimulationEngine:
+    """
+    Return a shared engine for these settings and SUT prompt, creating it on first use.
+
+    Engines are keyed by the identity of the settings object; the engine holds a
+    reference to it, so the id cannot be reused while the entry exists. A pooled
+    engine must only run one simulation at a time. Its connections are shared
+    sessions, closed at interpreter exit, so evicted engines are simply dropped.
+    """
+    key = (id(settings), sut_prompt_path)
+    with _engines_lock:
+        engine = _engines.get(key)
+        if engine is not None and engine.settings is settings:
+            _engines.move_to_end(key)
+            return engine
+        engine = _engines[key] = SimulationEngine(settings, sut_prompt_path=sut_prompt_path)
+        _engines.move_to_end(key)
+        while len(_engines) > _MAX_ENGINES:
+            _engines.popitem(last=False)
+        logger.debug("Created pooled simulation engine for %s", sut_prompt_path)
+        return engine
+
+def clear_engines() -> None:
+    """Drop every pooled engine; the next get_engine call builds a fresh one"""
+    with _engines_lock:
+        _engines.clear()
@@ -13,13 +13,18 @@ from dataclasses import dataclass
 
 from services import SUTClient, ProxyClient, LangfuseService
 from services.base_api_client import APIClientConfig
+from services.response_cache import ExactCache
 from services.langfuse_service import LangfuseConfig, ConversationMetadata
 from analysis import ConversationAnalyzer
-from analysis.models import ConversationStatus
+from analysis.models import ConversationStatus, field_dict
 from config.settings import Settings
 
 logger = logging.getLogger(__name__)
 
+# Shared by every engine so repeated deterministic runs replay earlier responses;
+# only used when settings.response_cache is on
+_RESPONSE_CACHE = ExactCache()
+
 @dataclass
 class UsageStats:
     """Track API usage and costs"""
@@ -45,10 +50,16 @@ class SimulationEngine:
         
         # Initialize usage tracking
         self.usage_stats = UsageStats()
+        # Messages attached to the previous SUT and proxy spans of the current conversation
+        self._span_messages: Dict[str, List[Dict[str, str]]] = {"sut": [], "proxy": []}
         
         logger.info("Simulation engine initialized with connection pooling (pool_connections={}, pool_maxsize={})".format(
             self.settings.pool_connections, self.settings.pool_maxsize))
     
+    def _response_cache(self) -> ExactCache | None:
+        """The shared response cache when enabled in settings, else None"""
+        return _RESPONSE_CACHE if self.settings.response_cache else None
+    
     def _create_sut_client(self) -> SUTClient:
         """Create SUT client from settings"""
         sut_config = self.settings.get_sut_api_config()
@@ -63,7 +74,7 @@ class SimulationEngine:
             pool_maxsize=self.settings.pool_maxsize,
             pool_block=False
         )
-        return SUTClient(config)
+        return SUTClient(config, cache=self._response_cache())
     
     def _create_proxy_client(self) -> ProxyClient:
         """Create proxy client from settings"""
@@ -79,7 +90,7 @@ class SimulationEngine:
             pool_maxsize=self.settings.pool_maxsize,
             pool_block=False
         )
-        return ProxyClient(config)
+        return ProxyClient(config, cache=self._response_cache())
     
     def _create_langfuse_service(self) -> LangfuseService:
         """Create Langfuse service from settings"""
@@ -243,6 +254,10 @@ class SimulationEngine:
         """
         import time
         
+        # Usage is reported per run, including when an engine is reused across runs
+        self.usage_stats = UsageStats()
+        self._span_messages = {"sut": [], "proxy": []}
+        
         deterministic_mode = bool(scenario.get('deterministic_mode', False))
         run_id = self._generate_run_id(persona, scenario, deterministic_mode, scenario.get('rng_seed'))
         max_turns = scenario.get("max_turns", self.settings.max_turns)
@@ -381,15 +396,17 @@ class SimulationEngine:
                 })
                 messages.append({"role": "user", "content": proxy_reply})
                 
-                # After generating the proxy reply, check for clarifying questions and tangents
-                if self.analyzer.check_clarifying_question(proxy_reply):
+                # After generating the proxy reply, check for clarifying questions and tangents;
+                # the reply is lowercased once for all three checks
+                proxy_reply_lower = proxy_reply.lower()
+                if self.analyzer.check_clarifying_question(proxy_reply, proxy_reply_lower):
                     logger.info(f"Clarifying question detected in turn {turn_idx + 1}")
 
-                if self.analyzer.check_tangent_inclusion(proxy_reply):
+                if self.analyzer.check_tangent_inclusion(proxy_reply, proxy_reply_lower):
                     logger.info(f"Tangent detected in turn {turn_idx + 1}")
 
                 # Check for conversation completion
-                if sut_provided_summary and self.analyzer.check_proxy_confirmation(proxy_reply):
+                if sut_provided_summary and self.analyzer.check_proxy_confirmation(proxy_reply, proxy_reply_lower):
                     logger.info(f"Conversation completed successfully at turn {turn_idx + 1}")
                     break
 
@@ -414,9 +431,6 @@ class SimulationEngine:
                 timeout_seconds,
             )
             
-            # Analyze conversation
-            conversation_summary = self.analyzer.extract_conversation_summary(turns)
-            
             # Check if proxy confirmed (look at last proxy response)
             proxy_confirmed = False
             if turns and turns[-1].get("role") == "user":
@@ -424,14 +438,14 @@ class SimulationEngine:
                     turns[-1].get("content", "")
                 )
             
-            final_outcome = self.analyzer.determine_conversation_outcome(
+            # Analyze conversation (summary, outcome and information in one pass)
+            conversation_summary, final_outcome, information_gathered = self.analyzer.analyze(
                 turns, sut_provided_summary, proxy_confirmed,
                 timeout_reached=timeout_reached,
                 api_errors=api_errors,
                 elapsed_time=final_elapsed_time,
                 timeout_limit=timeout_seconds
             )
-            information_gathered = self.analyzer.extract_information_gathered(turns)
             
             # Update Langfuse trace
             metadata = ConversationMetadata(
@@ -464,15 +478,15 @@ class SimulationEngine:
                     f.write(transcript_md)
             
             self.langfuse_service.update_trace_output(
-                conversation_summary.__dict__, final_outcome.__dict__, 
-                information_gathered.__dict__, transcript_md, metadata
+                field_dict(conversation_summary), field_dict(final_outcome), 
+                field_dict(information_gathered), transcript_md, metadata
             )
             
             # Create evaluation event
             self.langfuse_service.create_evaluation_event(
                 transcript_md, len(turns), persona["name"], scenario["title"],
-                conversation_summary.__dict__, final_outcome.__dict__, 
-                information_gathered.__dict__
+                field_dict(conversation_summary), field_dict(final_outcome), 
+                field_dict(information_gathered)
             )
             
             # Flush Langfuse data
@@ -484,9 +498,9 @@ class SimulationEngine:
                 "persona": persona["name"],
                 "scenario": scenario["title"],
                 "total_turns": len(turns),
-                "conversation_summary": conversation_summary.__dict__,
-                "final_outcome": final_outcome.__dict__,
-                "information_gathered": information_gathered.__dict__,
+                "conversation_summary": field_dict(conversation_summary),
+                "final_outcome": field_dict(final_outcome),
+                "information_gathered": field_dict(information_gathered),
                 "transcript_path": md_path,
                 "jsonl_path": jsonl_path,
                 "elapsed_time": 0.0 if deterministic_mode else final_elapsed_time,
@@ -525,13 +539,11 @@ class SimulationEngine:
                 for error in api_errors:
                     logger.error(f"  - {error}")
             
-            # Cleanup connections after simulation
-            self._cleanup_connections()
-            
+            # Connections stay open for the engine's next simulation and are closed at exit
             return results
     
     def _cleanup_connections(self):
-        """Cleanup API client connections"""
+        """Release this engine's API clients; the shared sessions are closed at exit"""
         try:
             if hasattr(self.sut_client, 'close'):
                 self.sut_client.close()
@@ -610,7 +622,8 @@ class SimulationEngine:
             {"role": "system", "content": recruiter_prompt}
         ] + messages
         
-        with self.langfuse_service.start_sut_span(turn_idx, messages_for_sut) as sut_span:
+        history_offset = self._span_history_offset("sut", messages_for_sut)
+        with self.langfuse_service.start_sut_span(turn_idx, messages_for_sut, history_offset) as sut_span:
             # Capture timestamp before API call
             timestamp = "00:00:00 01/01/1970" if deterministic else datetime.now().strftime("%H:%M:%S %d/%m/%Y")
             
@@ -669,7 +682,9 @@ class SimulationEngine:
                 # Create a synthetic first message using entry_context
                 messages_for_proxy = [{"role": "user", "content": entry_context}]
         
-        with self.langfuse_service.start_proxy_span(turn_idx, system_prompt, messages_for_proxy) as proxy_span:
+        history_offset = self._span_history_offset("proxy", messages_for_proxy)
+        with self.langfuse_service.start_proxy_span(turn_idx, system_prompt, messages_for_proxy,
+                                                    history_offset) as proxy_span:
             # Capture timestamp before API call
             timestamp = "00:00:00 01/01/1970" if deterministic else datetime.now().strftime("%H:%M:%S %d/%m/%Y")
             
@@ -806,6 +821,19 @@ class SimulationEngine:
             )
             return proxy_reply, model_name, timestamp
 
+    def _span_history_offset(self, kind: str, messages: List[Dict[str, str]]) -> int:
+        """
+        Number of leading messages already attached to the previous span of this kind.
+
+        Spans only record the messages past this offset. The offset is 0 when the history
+        no longer starts with what was recorded, e.g. after the intro system prompt or the
+        synthetic entry_context message of the first turn.
+        """
+        recorded = self._span_messages[kind]
+        offset = len(recorded) if messages[:len(recorded)] == recorded else 0
+        self._span_messages[kind] = list(messages)
+        return offset
+
     def _sanitize_messages_for_proxy(self, messages: List[Dict[str, str]]) -> List[Dict[str, str]]:
         """Remove system-role messages; keep only assistant/user for the proxy."""
         return [m for m in messages if m.get("role") in {"assistant", "user"}]
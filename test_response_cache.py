@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Check that the response cache replays identical requests without an HTTP call
+"""
+import pytest
+
+from config.settings import Settings
+from services import SUTClient
+from services.base_api_client import APIClientConfig
+from services.response_cache import ExactCache
+from simulation import SimulationEngine
+
+
+def _client(monkeypatch, cache):
+    client = SUTClient(APIClientConfig(url="http://sut.invalid/chat", headers={}, model="test-model"), cache=cache)
+    requests_made = []
+
+    def fake_request(payload):
+        requests_made.append(payload)
+        return {
+            "choices": [{"message": {"content": "How can I help you?"}}],
+            "usage": {"prompt_tokens": 5, "completion_tokens": 3, "total_tokens": 8},
+        }
+
+    monkeypatch.setattr(client, "_make_request", fake_request)
+    return client, requests_made
+
+
+def test_cache_hit_skips_http_call(monkeypatch):
+    cache = ExactCache()
+    client, requests_made = _client(monkeypatch, cache)
+    messages = [{"role": "user", "content": "Hi"}]
+
+    first = client.send_conversation(messages, temperature=0.0, top_p=1.0)
+    second = client.send_conversation(messages, temperature=0.0, top_p=1.0)
+
+    assert len(requests_made) == 1
+    assert second[0] == first[0]
+    assert second[1]["total_tokens"] == 0 and second[1]["cached"]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_high_temperature_is_not_cached(monkeypatch):
+    client, requests_made = _client(monkeypatch, ExactCache())
+    messages = [{"role": "user", "content": "Hi"}]
+
+    client.send_conversation(messages, temperature=0.9, top_p=1.0)
+    client.send_conversation(messages, temperature=0.9, top_p=1.0)
+
+    assert len(requests_made) == 2
+
+
+@pytest.mark.parametrize("enabled", [False, True])
+def test_engine_clients_use_cache_only_when_enabled(monkeypatch, enabled):
+    # No Langfuse keys are needed to build an engine here
+    monkeypatch.setenv("SKIP_VALIDATION", "true")
+    engine = SimulationEngine(Settings(openrouter_api_key="test", response_cache=enabled))
+    assert (engine.sut_client.cache is not None) is enabled
+    assert (engine.proxy_client.cache is not None) is enabled
+    assert engine.sut_client.cache is engine.proxy_client.cache
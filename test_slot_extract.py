@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Check that per-trace incremental slot extraction matches a scan of the whole joined history
+"""
+import pytest
+
+
+@pytest.fixture
+def app_module(monkeypatch):
+    # Importing app builds settings; no API keys are needed for slot extraction
+    monkeypatch.setenv("SKIP_VALIDATION", "true")
+    import app
+    app._slot_state.clear()
+    return app
+
+
+def test_keyword_split_across_messages(app_module):
+    history = ["We are hiring a senior", "backend engineer for the platform team"]
+    assert app_module.naive_slot_extract(history)["title"] == "Senior Backend Engineer"
+    assert app_module.incremental_slot_extract("t1", history)["title"] == "Senior Backend Engineer"
+
+
+def test_keyword_split_across_calls(app_module):
+    history = ["Hi, how can I help?", "I need a Senior Backend"]
+    assert app_module.incremental_slot_extract("t1", history)["title"] is None
+    history += ["Engineer in Berlin", "Great, what seniority?", "Staff level"]
+    assert app_module.incremental_slot_extract("t1", history)["title"] == "Senior Backend Engineer"
+
+
+def test_growing_history_matches_full_scan(app_module):
+    messages = ["Hello", "senior", "backend", "engineer", "ok", "Senior Backend Engineer", "thanks"]
+    for end in range(len(messages) + 1):
+        history = messages[:end]
+        assert app_module.incremental_slot_extract("t1", history) == app_module.naive_slot_extract(history)
+
+
+def test_edited_history_of_same_length_is_rescanned(app_module):
+    assert app_module.incremental_slot_extract("t1", ["Senior Backend Engineer", "ok"])["title"] is not None
+    assert app_module.incremental_slot_extract("t1", ["Product Designer", "ok?"])["title"] is None
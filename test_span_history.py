@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Check that the message deltas attached to SUT and proxy spans rebuild the full history
+"""
+import contextlib
+import glob
+from types import SimpleNamespace
+
+import pytest
+import yaml
+
+from config.settings import Settings
+from services.langfuse_service import _span_messages_input
+from simulation import SimulationEngine
+
+
+class _RecordingClient:
+    """Stands in for the SUT or proxy client and records every message list it is sent"""
+
+    def __init__(self, reply: str):
+        self.config = SimpleNamespace(model="test-model")
+        self.sent = []
+        self._reply = reply
+
+    def _respond(self, messages):
+        self.sent.append(list(messages))
+        usage = {"input_tokens": 1, "output_tokens": 1, "total_tokens": 2}
+        return f"{self._reply} {len(self.sent)}", usage
+
+    def send_conversation(self, messages, temperature=None, top_p=None):
+        return self._respond(messages)
+
+    def send_persona_message(self, persona, scenario, messages):
+        return self._respond(messages)
+
+    def close(self):
+        pass
+
+
+class _RecordingLangfuse:
+    """Records the input of every SUT and proxy span"""
+
+    def __init__(self):
+        self.spans = {"sut": [], "proxy": []}
+
+    def _span(self, kind, messages, history_offset):
+        self.spans[kind].append(_span_messages_input(list(messages), history_offset))
+        return contextlib.nullcontext(SimpleNamespace(update=lambda **kwargs: None))
+
+    def start_sut_span(self, turn_idx, messages, history_offset=0):
+        return self._span("sut", messages, history_offset)
+
+    def start_proxy_span(self, turn_idx, system_prompt, messages, history_offset=0):
+        return self._span("proxy", messages, history_offset)
+
+    def start_conversation_trace(self, *args, **kwargs):
+        return contextlib.nullcontext(None)
+
+    def __getattr__(self, name):
+        # Trace tags, outputs, evaluation events and flush are not checked here
+        return lambda *args, **kwargs: None
+
+
+def _rebuild(span_inputs):
+    """Replay span inputs into the message list each span stood for"""
+    history = []
+    rebuilt = []
+    for span_input in span_inputs:
+        history = history[:span_input.get("history_offset", 0)] + span_input["messages"]
+        rebuilt.append(history)
+    return rebuilt
+
+
+@pytest.mark.parametrize("entry_context", ["", "We need to hire a backend engineer."])
+def test_span_deltas_rebuild_transcript(tmp_path, monkeypatch, entry_context):
+    # No Langfuse keys are needed; spans go to the recording service below
+    monkeypatch.setenv("SKIP_VALIDATION", "true")
+    persona = yaml.safe_load(open(sorted(glob.glob("personas/*.yml"))[0]))
+    scenario = yaml.safe_load(open(sorted(glob.glob("scenarios/*.yml"))[0]))
+    scenario.update(entry_context=entry_context, max_turns=4, use_controller=False)
+
+    engine = SimulationEngine(Settings(max_turns=4, openrouter_api_key="test"))
+    engine.sut_client = _RecordingClient("SUT reply")
+    engine.proxy_client = _RecordingClient("Persona reply")
+    engine.langfuse_service = _RecordingLangfuse()
+    with engine:
+        engine.run_simulation(persona, scenario, str(tmp_path))
+
+    assert len(engine.sut_client.sent) > 2
+    assert _rebuild(engine.langfuse_service.spans["sut"]) == engine.sut_client.sent
+    assert _rebuild(engine.langfuse_service.spans["proxy"]) == engine.proxy_client.sent